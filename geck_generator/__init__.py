@@ -8,11 +8,32 @@ Supports four interfaces:
 - Preset profiles
 """
 
-__version__ = "1.0.0"
+from importlib import import_module
+
+from geck_generator._version import __version__
+
 __author__ = "GECK Generator"
 
-from geck_generator.core.generator import GECKGenerator
-from geck_generator.core.profiles import ProfileManager
-from geck_generator.core.templates import TemplateEngine
+# Public classes are resolved on first access (PEP 562) so that importing the
+# package - e.g. for `python -m geck_generator --version` - doesn't pull Jinja2.
+_LAZY_EXPORTS = {
+    "GECKGenerator": "geck_generator.core.generator",
+    "ProfileManager": "geck_generator.core.profiles",
+    "TemplateEngine": "geck_generator.core.templates",
+}
 
 __all__ = ["GECKGenerator", "ProfileManager", "TemplateEngine", "__version__"]
+
+
+def __getattr__(name: str):
+    """Lazily import and cache public classes."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
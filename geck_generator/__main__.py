@@ -2,23 +2,19 @@
 
 import argparse
 import sys
-from pathlib import Path
 
-from geck_generator import __version__
+from geck_generator._version import __version__
 
 
-def main():
-    """Main entry point for GECK Generator."""
-    parser = argparse.ArgumentParser(
-        description="GECK Generator - Generate LLM_init.md files for GECK v1.2 projects",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+# Help epilog, stored already dedented so RawDescriptionHelpFormatter emits it as-is
+_EPILOG = """\
 Examples:
   python -m geck_generator --cli              # Interactive CLI
   python -m geck_generator --gui              # GUI application
   python -m geck_generator --profile web_app -o ./project/LLM_init.md
   python -m geck_generator --cli --init-geck  # Create full GECK folder
   python -m geck_generator --list-profiles    # Show available profiles
+  python -m geck_generator --precompile-templates  # Warm the template cache
 
 Shortcut Management:
   python -m geck_generator --install-shortcut        # Create desktop & menu shortcuts
@@ -26,7 +22,15 @@ Shortcut Management:
   python -m geck_generator --install-shortcut menu     # Start menu only
   python -m geck_generator --uninstall-shortcut      # Remove all shortcuts
   python -m geck_generator --shortcut-info           # Show shortcut locations
-        """,
+"""
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the full command-line argument parser."""
+    parser = argparse.ArgumentParser(
+        description="GECK Generator - Generate LLM_init.md files for GECK v1.2 projects",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG,
     )
 
     parser.add_argument(
@@ -98,6 +102,12 @@ Shortcut Management:
         help="Project goal (for --profile mode)",
     )
 
+    parser.add_argument(
+        "--precompile-templates",
+        action="store_true",
+        help="Compile built-in templates into the bytecode cache",
+    )
+
     # Shortcut management arguments
     parser.add_argument(
         "--install-shortcut",
@@ -120,19 +130,98 @@ Shortcut Management:
         help="Show shortcut locations for current platform",
     )
 
+    return parser
+
+
+def _write_lines(lines: list[str]) -> None:
+    """Write a block of output lines to stdout in a single call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _print_version() -> int:
+    """Print the version string."""
+    print(f"GECK Generator {__version__}")
+    return 0
+
+
+def _show_shortcut_info() -> int:
+    """Print shortcut locations for the current platform."""
+    from geck_generator.utils.shortcuts import get_shortcut_info
+    info = get_shortcut_info()
+    _write_lines([
+        f"\nShortcut Information ({info['platform']}):",
+        "-" * 50,
+        f"  Desktop location: {info['desktop']}",
+        f"  Menu location:    {info['menu']}",
+        f"  Shortcut type:    {info['shortcut_type']}",
+        "",
+    ])
+    return 0
+
+
+def _list_profiles() -> int:
+    """Print all available preset profiles."""
+    # The precomputed module-level listing; no ProfileManager is needed
+    from geck_generator.core.profiles import PROFILE_CHOICES
+    lines = ["\nAvailable Profiles:", "-" * 60]
+    for key, name, desc in PROFILE_CHOICES:
+        lines.append(f"  {key:20s} {name}")
+        if desc:
+            lines.append(f"                       {desc}")
+    lines.append("")
+    _write_lines(lines)
+    return 0
+
+
+def _list_templates() -> int:
+    """Print all available templates."""
+    # Reads the class attribute only; no Jinja2 environment is built
+    from geck_generator.core.templates import TemplateEngine
+    lines = ["\nAvailable Templates:", "-" * 40]
+    lines.extend(f"  {name}" for name in TemplateEngine.TEMPLATES)
+    lines.append("")
+    _write_lines(lines)
+    return 0
+
+
+def _precompile_templates() -> int:
+    """Compile built-in templates so later runs load them from cache."""
+    from geck_generator.core.templates import TemplateEngine
+    names = TemplateEngine().precompile()
+    print(f"Precompiled {len(names)} templates: {', '.join(names)}")
+    return 0
+
+
+def _prompt(label: str) -> str:
+    """Prompt on stdout and read one stripped line from stdin (no readline)."""
+    sys.stdout.write(label)
+    sys.stdout.flush()
+    return sys.stdin.readline().strip()
+
+
+# Argument-free commands that can be answered without building the parser
+_FAST_COMMANDS = {
+    "--version": _print_version,
+    "--shortcut-info": _show_shortcut_info,
+    "--list-profiles": _list_profiles,
+    "--list-templates": _list_templates,
+    "--precompile-templates": _precompile_templates,
+}
+
+
+def main():
+    """Main entry point for GECK Generator."""
+    # Fast path: a single cheap flag doesn't need the full ArgumentParser
+    argv = sys.argv[1:]
+    if len(argv) == 1 and argv[0] in _FAST_COMMANDS:
+        return _FAST_COMMANDS[argv[0]]()
+
+    parser = _build_parser()
     args = parser.parse_args()
 
     # Handle --shortcut-info
     if args.shortcut_info:
-        from geck_generator.utils.shortcuts import get_shortcut_info
-        info = get_shortcut_info()
-        print(f"\nShortcut Information ({info['platform']}):")
-        print("-" * 50)
-        print(f"  Desktop location: {info['desktop']}")
-        print(f"  Menu location:    {info['menu']}")
-        print(f"  Shortcut type:    {info['shortcut_type']}")
-        print()
-        return 0
+        return _show_shortcut_info()
 
     # Handle --install-shortcut
     if args.install_shortcut:
@@ -141,10 +230,10 @@ Shortcut Management:
             print(f"\nCreating shortcuts on {get_platform()}...")
             created = create_shortcuts(args.install_shortcut)
             if created:
-                print("\nShortcuts created successfully:")
-                for path in created:
-                    print(f"  - {path}")
-                print("\nYou can now launch GECK Generator from your desktop or start menu.")
+                lines = ["\nShortcuts created successfully:"]
+                lines.extend(f"  - {path}" for path in created)
+                lines.append("\nYou can now launch GECK Generator from your desktop or start menu.")
+                _write_lines(lines)
             else:
                 print("No shortcuts were created.")
             return 0
@@ -158,9 +247,9 @@ Shortcut Management:
         try:
             removed = remove_shortcuts()
             if removed:
-                print("\nShortcuts removed:")
-                for path in removed:
-                    print(f"  - {path}")
+                lines = ["\nShortcuts removed:"]
+                lines.extend(f"  - {path}" for path in removed)
+                _write_lines(lines)
             else:
                 print("No shortcuts found to remove.")
             return 0
@@ -170,27 +259,15 @@ Shortcut Management:
 
     # Handle --list-profiles
     if args.list_profiles:
-        from geck_generator.core.profiles import ProfileManager
-        profiles = ProfileManager()
-        print("\nAvailable Profiles:")
-        print("-" * 60)
-        for key, name, desc in profiles.get_profile_names_with_descriptions():
-            print(f"  {key:20s} {name}")
-            if desc:
-                print(f"                       {desc}")
-        print()
-        return 0
+        return _list_profiles()
 
     # Handle --list-templates
     if args.list_templates:
-        from geck_generator.core.templates import TemplateEngine
-        engine = TemplateEngine()
-        print("\nAvailable Templates:")
-        print("-" * 40)
-        for name in engine.list_templates():
-            print(f"  {name}")
-        print()
-        return 0
+        return _list_templates()
+
+    # Handle --precompile-templates
+    if args.precompile_templates:
+        return _precompile_templates()
 
     # Handle --gui
     if args.gui:
@@ -219,31 +296,34 @@ Shortcut Management:
 
     # Handle --profile (quick generation)
     if args.profile:
+        from pathlib import Path
+
         from geck_generator.core.generator import GECKGenerator
-        from geck_generator.core.profiles import ProfileManager
+        from geck_generator.core.profiles import get_profile_manager
+
+        # Check if profile exists before setting up generation
+        profiles = get_profile_manager()
+        if args.profile not in profiles.known_profile_names:
+            print(
+                f"Error: Profile '{args.profile}' not found. "
+                f"Available: {list(profiles.list_profiles())}"
+            )
+            return 1
 
         generator = GECKGenerator()
-        profiles = ProfileManager()
-
-        # Check if profile exists
-        try:
-            profiles.get_profile(args.profile)
-        except KeyError as e:
-            print(f"Error: {e}")
-            return 1
 
         # Get project name and goal
         project_name = args.project_name
         goal = args.goal
 
         if not project_name:
-            project_name = input("Project name: ").strip()
+            project_name = _prompt("Project name: ")
             if not project_name:
                 print("Error: Project name is required")
                 return 1
 
         if not goal:
-            goal = input("Project goal: ").strip()
+            goal = _prompt("Project goal: ")
             if not goal:
                 print("Error: Project goal is required")
                 return 1
@@ -269,6 +349,8 @@ Shortcut Management:
 
     # Handle --template (custom template)
     if args.template:
+        from pathlib import Path
+
         from geck_generator.core.generator import GECKGenerator
 
         generator = GECKGenerator()
@@ -284,18 +366,16 @@ Shortcut Management:
 
         # Common variables
         for var in ["project_name", "goal", "context"]:
-            value = input(f"  {var}: ").strip()
+            value = _prompt(f"  {var}: ")
             if value:
                 variables[var] = value
 
-        content = generator.generate_from_template_file(template_path, variables)
-
         if args.output:
             output_path = Path(args.output)
-            output_path.write_text(content, encoding="utf-8")
+            generator.generate_from_template_file(template_path, variables, output_path)
             print(f"Generated: {output_path}")
         else:
-            print(content)
+            print(generator.generate_from_template_file(template_path, variables))
 
         return 0
 
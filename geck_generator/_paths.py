@@ -0,0 +1,21 @@
+"""Per-user filesystem locations used by GECK Generator."""
+
+import os
+import sys
+from pathlib import Path
+
+
+def user_cache_dir() -> Path:
+    """
+    Get the per-user cache directory for GECK Generator.
+
+    Returns:
+        Platform-appropriate cache directory (not guaranteed to exist)
+    """
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Caches"
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "geck_generator"
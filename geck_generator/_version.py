@@ -0,0 +1,3 @@
+"""Version information for GECK Generator."""
+
+__version__ = "1.0.0"
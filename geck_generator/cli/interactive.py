@@ -1,13 +1,11 @@
 """Interactive CLI using questionary for GECK Generator."""
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-import questionary
-from questionary import Style
-
 from geck_generator.core.generator import GECKGenerator
-from geck_generator.core.profiles import ProfileManager
+from geck_generator.core.profiles import get_profile_manager
 from geck_generator.utils.validators import (
     validate_url,
     validate_path,
@@ -17,18 +15,86 @@ from geck_generator.utils.validators import (
 )
 
 
-# Custom style for the CLI
-custom_style = Style([
-    ("qmark", "fg:cyan bold"),
-    ("question", "bold"),
-    ("answer", "fg:green"),
-    ("pointer", "fg:cyan bold"),
-    ("highlighted", "fg:cyan bold"),
-    ("selected", "fg:green"),
-    ("separator", "fg:gray"),
-    ("instruction", "fg:gray"),
-    ("text", ""),
-])
+@lru_cache(maxsize=1)
+def _get_custom_style():
+    """
+    Build the custom questionary style for the CLI.
+
+    questionary (and prompt_toolkit) are imported here rather than at module
+    level so importing this module stays cheap until prompts are shown.
+
+    Returns:
+        questionary Style instance
+    """
+    from questionary import Style
+
+    return Style([
+        ("qmark", "fg:cyan bold"),
+        ("question", "bold"),
+        ("answer", "fg:green"),
+        ("pointer", "fg:cyan bold"),
+        ("highlighted", "fg:cyan bold"),
+        ("selected", "fg:green"),
+        ("separator", "fg:gray"),
+        ("instruction", "fg:gray"),
+        ("text", ""),
+    ])
+
+
+# Prompt validators run on every keystroke; the underlying checks are pure
+# functions of the text, so memoize them (and collapse the (ok, msg) tuple
+# into questionary's True-or-message convention with a single call).
+@lru_cache(maxsize=64)
+def _check_project_name(value: str) -> bool | str:
+    """Validate a project name for questionary."""
+    is_valid, message = validate_project_name(value)
+    return is_valid or message
+
+
+@lru_cache(maxsize=64)
+def _check_url(value: str) -> bool | str:
+    """Validate a repository URL for questionary."""
+    is_valid, message = validate_url(value)
+    return is_valid or message
+
+
+@lru_cache(maxsize=64)
+def _check_goal(value: str) -> bool | str:
+    """Validate a project goal for questionary."""
+    is_valid, message = validate_goal(value)
+    return is_valid or message
+
+
+@lru_cache(maxsize=1)
+def _cwd() -> str:
+    """Get the working directory once per session for default paths."""
+    return str(Path.cwd())
+
+
+@lru_cache(maxsize=16)
+def _suggest_repo_url(local_path: str) -> str:
+    """Suggest a repo URL for a path, running git at most once per path."""
+    return suggest_repo_url(local_path) or ""
+
+
+# Category and built-in profile listings are static, so their menu titles are
+# formatted once per process and reused by every prompt.
+@lru_cache(maxsize=1)
+def _category_choice_titles() -> tuple[tuple[str, str], ...]:
+    """Get (title, category_key) pairs for the category menu."""
+    return tuple(
+        (f"{cat['name']} - {cat['description']}", cat["key"])
+        for cat in get_profile_manager().get_categories_with_profiles()
+    )
+
+
+@lru_cache(maxsize=None)
+def _profile_choice_titles(category_key: str) -> tuple[tuple[str, str], ...]:
+    """Get (title, profile_key) pairs for a category's profile menu."""
+    return tuple(
+        (f"{name} - {desc}", key)
+        for key, name, desc in get_profile_manager().get_profiles_for_category(category_key)
+    )
 
 
 def run_interactive() -> dict[str, Any]:
@@ -38,12 +104,16 @@ def run_interactive() -> dict[str, Any]:
     Returns:
         Configuration dictionary collected from user input
     """
+    import questionary
+
+    custom_style = _get_custom_style()
+
     print("\n" + "=" * 60)
     print("  GECK Generator - Interactive Setup")
     print("=" * 60 + "\n")
 
     config: dict[str, Any] = {}
-    profiles = ProfileManager()
+    profiles = get_profile_manager()
     generator = GECKGenerator()
 
     # Step 1: Basic info
@@ -51,7 +121,7 @@ def run_interactive() -> dict[str, Any]:
 
     config["project_name"] = questionary.text(
         "Project name:",
-        validate=lambda x: validate_project_name(x)[0] or validate_project_name(x)[1],
+        validate=_check_project_name,
         style=custom_style,
     ).ask()
 
@@ -59,7 +129,7 @@ def run_interactive() -> dict[str, Any]:
         raise KeyboardInterrupt("User cancelled")
 
     # Get local path with suggestion
-    default_path = str(Path.cwd())
+    default_path = _cwd()
     config["local_path"] = questionary.path(
         "Local project path:",
         default=default_path,
@@ -70,11 +140,11 @@ def run_interactive() -> dict[str, Any]:
         raise KeyboardInterrupt("User cancelled")
 
     # Try to suggest repo URL
-    suggested_url = suggest_repo_url(config["local_path"]) or ""
+    suggested_url = _suggest_repo_url(config["local_path"])
     config["repo_url"] = questionary.text(
         "Repository URL (optional):",
         default=suggested_url,
-        validate=lambda x: validate_url(x)[0] or validate_url(x)[1],
+        validate=_check_url,
         style=custom_style,
     ).ask()
 
@@ -95,16 +165,12 @@ def run_interactive() -> dict[str, Any]:
 
     if use_profile:
         # First, select a category
-        category_choices = []
-        for cat in profiles.get_categories_with_profiles():
-            category_choices.append(questionary.Choice(
-                title=f"{cat['name']} - {cat['description']}",
-                value=cat["key"],
-            ))
-
         selected_category = questionary.select(
             "Select a category:",
-            choices=category_choices,
+            choices=[
+                questionary.Choice(title=title, value=key)
+                for title, key in _category_choice_titles()
+            ],
             style=custom_style,
         ).ask()
 
@@ -112,16 +178,12 @@ def run_interactive() -> dict[str, Any]:
             raise KeyboardInterrupt("User cancelled")
 
         # Then, select a profile within that category
-        profile_choices = []
-        for key, name, desc in profiles.get_profiles_for_category(selected_category):
-            profile_choices.append(questionary.Choice(
-                title=f"{name} - {desc}",
-                value=key,
-            ))
-
         config["profile"] = questionary.select(
             "Select a profile:",
-            choices=profile_choices,
+            choices=[
+                questionary.Choice(title=title, value=key)
+                for title, key in _profile_choice_titles(selected_category)
+            ],
             style=custom_style,
         ).ask()
 
@@ -144,7 +206,7 @@ def run_interactive() -> dict[str, Any]:
     config["goal"] = questionary.text(
         "Describe the project goal (what should exist when done):",
         multiline=True,
-        validate=lambda x: validate_goal(x)[0] or validate_goal(x)[1],
+        validate=_check_goal,
         instruction="(Press Alt+Enter or Esc then Enter to finish)",
         style=custom_style,
     ).ask()
@@ -183,7 +245,7 @@ def run_interactive() -> dict[str, Any]:
             ).ask()
 
             if use_suggested:
-                criteria = suggested.copy()
+                criteria = list(suggested)
 
     print("  Add your own success criteria (empty input to finish):")
     while True:
@@ -255,7 +317,7 @@ def run_interactive() -> dict[str, Any]:
     ).ask()
 
     if config["platforms"] is None:
-        config["platforms"] = default_platforms
+        config["platforms"] = list(default_platforms)
 
     # Step 6: Initial task
     print("\n🚀 Step 6: Initial Task\n")
@@ -292,6 +354,10 @@ def run_cli_and_save(init_geck: bool = False) -> Path | None:
     Returns:
         Path to the created file/folder, or None if cancelled
     """
+    import questionary
+
+    custom_style = _get_custom_style()
+
     try:
         config = run_interactive()
     except KeyboardInterrupt:
@@ -305,7 +371,7 @@ def run_cli_and_save(init_geck: bool = False) -> Path | None:
         # Create full GECK folder
         output_path = questionary.path(
             "Create GECK folder in which directory?",
-            default=config.get("local_path", str(Path.cwd())),
+            default=config.get("local_path", _cwd()),
             style=custom_style,
         ).ask()
 
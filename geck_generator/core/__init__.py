@@ -1,7 +1,28 @@
 """Core components for GECK generation."""
 
-from geck_generator.core.generator import GECKGenerator
-from geck_generator.core.profiles import ProfileManager
-from geck_generator.core.templates import TemplateEngine
+from importlib import import_module
 
-__all__ = ["GECKGenerator", "ProfileManager", "TemplateEngine"]
+# Resolved on first access so importing a single submodule (e.g. profiles)
+# doesn't drag in the Jinja2-backed template engine.
+_LAZY_EXPORTS = {
+    "GeckConfig": "geck_generator.core.config",
+    "GECKGenerator": "geck_generator.core.generator",
+    "ProfileManager": "geck_generator.core.profiles",
+    "TemplateEngine": "geck_generator.core.templates",
+}
+
+__all__ = ["GeckConfig", "GECKGenerator", "ProfileManager", "TemplateEngine"]
+
+
+def __getattr__(name: str):
+    """Lazily import and cache public classes."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
@@ -0,0 +1,54 @@
+"""Typed project configuration for GECK Generator."""
+
+from dataclasses import asdict, dataclass, field, fields
+from typing import Any
+
+
+@dataclass(slots=True)
+class GeckConfig:
+    """
+    Project configuration with the well-known GECK fields.
+
+    GECKGenerator accepts either a GeckConfig or a plain config dict; a
+    GeckConfig is converted to a dict only at the template boundary.
+    """
+
+    project_name: str = ""
+    repo_url: str = ""
+    local_path: str = ""
+    profile: str | None = None
+    goal: str = ""
+    success_criteria: list[str] = field(default_factory=list)
+    languages: str = ""
+    frameworks: list[str] = field(default_factory=list)
+    must_use: str = ""
+    must_avoid: str = ""
+    platforms: list[str] = field(default_factory=list)
+    context: str = ""
+    initial_task: str = ""
+    git_branch: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Convert to a plain config dictionary.
+
+        Returns:
+            Dictionary with one entry per field
+        """
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, config: dict[str, Any]) -> "GeckConfig":
+        """
+        Build a GeckConfig from a config dictionary.
+
+        Keys that aren't GeckConfig fields (e.g. profile metadata) are ignored.
+
+        Args:
+            config: Configuration dictionary
+
+        Returns:
+            New GeckConfig instance
+        """
+        names = {f.name for f in fields(cls)}
+        return cls(**{key: value for key, value in config.items() if key in names})
@@ -1,23 +1,113 @@
 """Main generation logic for GECK Generator."""
 
 import os
-import platform
-import subprocess
-from datetime import datetime
+import sys
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import MISSING, fields
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Hashable
 
-from geck_generator.core.templates import TemplateEngine
-from geck_generator.core.profiles import ProfileManager, ReporProfileManager
+from geck_generator._paths import user_cache_dir
+from geck_generator.core.config import GeckConfig
 
+if TYPE_CHECKING:
+    from geck_generator.core.profiles import ProfileManager
+    from geck_generator.core.templates import TemplateEngine
 
-def _detect_environment() -> dict:
+
+# Probed environment info is reused across runs for this many seconds
+_ENV_CACHE_TTL = 3600
+_ENV_KEYS = frozenset({"os_info", "shell_info", "runtime_versions"})
+
+
+def _env_cache_path() -> Path:
+    """Get the path of the on-disk environment cache."""
+    return user_cache_dir() / "env.json"
+
+
+def _env_cache_key() -> list[str]:
+    """Get the values that must match for a cached environment to be reused."""
+    # A different interpreter or PATH can change every probed version
+    return [sys.executable, os.environ.get("PATH", "")]
+
+
+def _read_env_cache(cache_path: Path) -> dict | None:
     """
-    Detect current environment info: OS, shell, runtime versions.
+    Read the cached environment info if it's fresh and for this environment.
+
+    Args:
+        cache_path: Path to the cache file
 
     Returns:
-        Dict with os_info, shell_info, runtime_versions, timestamp
+        Dict with os_info, shell_info, runtime_versions, or None if unusable
+    """
+    import json
+
+    try:
+        if time.time() - cache_path.stat().st_mtime >= _ENV_CACHE_TTL:
+            return None
+        cached = json.loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("key") != _env_cache_key():
+        return None
+    env = cached.get("env")
+    if not isinstance(env, dict) or not _ENV_KEYS <= env.keys():
+        return None
+    return env
+
+
+def _write_env_cache(cache_path: Path, env: dict) -> None:
+    """Write environment info to the on-disk cache, ignoring failures."""
+    import json
+
+    payload = json.dumps({"key": _env_cache_key(), "env": env}, separators=(",", ":"))
+    try:
+        cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        _write_bytes(cache_path, payload.encode("utf-8"))
+    except OSError:
+        pass
+
+
+@lru_cache(maxsize=1)
+def _detect_static_environment() -> dict:
+    """
+    Detect environment info that doesn't change during a process: OS, shell,
+    runtime versions.
+
+    The result is cached in memory, and on disk for _ENV_CACHE_TTL seconds so
+    later runs skip the version probes; call
+    ``_detect_static_environment.cache_clear()`` to force a fresh lookup.
+
+    Returns:
+        Dict with os_info, shell_info, runtime_versions
+    """
+    cache_path = _env_cache_path()
+    cached = _read_env_cache(cache_path)
+    if cached is not None:
+        return cached
+
+    env = _probe_static_environment()
+    _write_env_cache(cache_path, env)
+    return env
+
+
+def _probe_static_environment() -> dict:
+    """
+    Probe the OS, shell and runtime versions.
+
+    Returns:
+        Dict with os_info, shell_info, runtime_versions
     """
+    # Imported here: only environment detection needs them
+    import platform
+    import shutil
+    import subprocess
+
     # Detect OS
     os_name = platform.system()
     os_release = platform.release()
@@ -35,7 +125,7 @@ def _detect_environment() -> dict:
     else:
         shell_info = os.environ.get("SHELL", "/bin/bash")
         # Extract just the shell name
-        shell_info = Path(shell_info).name
+        shell_info = shell_info.rpartition("/")[2] or shell_info
 
     # Detect runtime versions
     runtime_versions = {}
@@ -45,13 +135,18 @@ def _detect_environment() -> dict:
 
     # Try to detect other tools with timeout
     def get_version(cmd: list[str], timeout: float = 2.0) -> str | None:
+        # Don't spawn a process for a tool that isn't on PATH. Running the
+        # resolved path directly (no shell) also works for Windows .cmd shims
+        # such as npm, without starting cmd.exe as a middleman.
+        executable = shutil.which(cmd[0])
+        if executable is None:
+            return None
         try:
             result = subprocess.run(
-                cmd,
+                [executable, *cmd[1:]],
                 capture_output=True,
                 text=True,
                 timeout=timeout,
-                shell=(os_name == "Windows"),
             )
             if result.returncode == 0:
                 return result.stdout.strip().split("\n")[0]
@@ -59,59 +154,310 @@ def _detect_environment() -> dict:
             pass
         return None
 
+    # Probe the tools concurrently; each probe is dominated by process startup,
+    # so total wall time drops to roughly that of the slowest one
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        node_future = executor.submit(get_version, ["node", "--version"])
+        npm_future = executor.submit(get_version, ["npm", "--version"])
+        git_future = executor.submit(get_version, ["git", "--version"])
+
     # Node.js
-    node_version = get_version(["node", "--version"])
+    node_version = node_future.result()
     if node_version:
         runtime_versions["Node.js"] = node_version.lstrip("v")
 
     # npm
-    npm_version = get_version(["npm", "--version"])
+    npm_version = npm_future.result()
     if npm_version:
         runtime_versions["npm"] = npm_version
 
     # git
-    git_version = get_version(["git", "--version"])
+    git_version = git_future.result()
     if git_version:
         # "git version 2.39.0" -> "2.39.0"
         parts = git_version.split()
         if len(parts) >= 3:
             runtime_versions["git"] = parts[2]
 
-    # Generate timestamp
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
     return {
         "os_info": os_info,
         "shell_info": shell_info,
         "runtime_versions": runtime_versions,
-        "timestamp": timestamp,
     }
 
 
-class GECKGenerator:
-    """Central class that orchestrates GECK file generation."""
+def _detect_environment() -> dict:
+    """
+    Detect current environment info: OS, shell, runtime versions.
+
+    Only the timestamp is recomputed on each call; the rest comes from
+    the cached _detect_static_environment().
+
+    Returns:
+        Dict with os_info, shell_info, runtime_versions, timestamp
+    """
+    static_env = _detect_static_environment()
+    return {
+        "os_info": static_env["os_info"],
+        "shell_info": static_env["shell_info"],
+        "runtime_versions": dict(static_env["runtime_versions"]),
+        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+    }
+
+
+# Flags for raw file writes (O_BINARY keeps Windows from translating newlines
+# a second time; _encode_text() already applies the platform line endings)
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def _encode_text(content: str) -> bytes:
+    """Encode text as UTF-8 with platform line endings, as a text-mode write would."""
+    if os.linesep != "\n":
+        content = content.replace("\n", os.linesep)
+    return content.encode("utf-8")
+
+
+def _write_file(path: Path, content: str) -> None:
+    """Write text content with a single open/write/close on a raw fd."""
+    _write_bytes(path, _encode_text(content))
+
+
+def _write_bytes(path: Path, data: bytes) -> None:
+    """Write bytes to a file with a single open/write/close on a raw fd."""
+    data = memoryview(data)
+    fd = os.open(path, _WRITE_FLAGS, 0o666)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+
+# Output directories already created by this process; lets repeated writes
+# into the same directory skip the mkdir/stat walk.
+_CREATED_DIRS: set[Path] = set()
+
+
+def _write_output(path: Path, content: str) -> None:
+    """Write content to a file, creating its parent directory on first use."""
+    parent = path.parent
+    if parent not in _CREATED_DIRS:
+        parent.mkdir(parents=True, exist_ok=True)
+        _CREATED_DIRS.add(parent)
+    try:
+        _write_file(path, content)
+    except FileNotFoundError:
+        # The directory was removed after it was cached; recreate it
+        parent.mkdir(parents=True, exist_ok=True)
+        _write_file(path, content)
+
+
+# Sidecar in the GECK folder recording what init_geck_folder last wrote:
+# {filename: {"digest": ..., "size": ..., "mtime_ns": ...}}
+_MANIFEST_NAME = ".geck-manifest.json"
+
+
+def _load_manifest(geck_folder: Path) -> dict[str, dict[str, Any]]:
+    """Load the write manifest, or return an empty one if missing or invalid."""
+    import json
+
+    try:
+        manifest = json.loads((geck_folder / _MANIFEST_NAME).read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def _write_if_changed(path: Path, data: bytes, entry: Any) -> dict[str, Any] | None:
+    """
+    Write data to path unless the manifest shows it already holds that content.
+
+    The file counts as unchanged only if its digest matches and its size and
+    mtime still match what was recorded, so files edited since the last
+    write are always rewritten.
+
+    Args:
+        path: File to write
+        data: Encoded file content
+        entry: The file's manifest entry from the previous write, if any
+
+    Returns:
+        New manifest entry if the file was written, None if it was skipped
+    """
+    import hashlib
+
+    digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+    if isinstance(entry, dict) and entry.get("digest") == digest:
+        try:
+            stat = path.stat()
+        except OSError:
+            pass
+        else:
+            if stat.st_size == entry.get("size") and stat.st_mtime_ns == entry.get("mtime_ns"):
+                return None
+
+    _write_bytes(path, data)
+    stat = path.stat()
+    return {"digest": digest, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _read_git_remote_url(git_config: Path) -> str | None:
+    """
+    Read the remote URL from a repository's .git/config.
+
+    Prefers ``remote "origin"``; falls back to the first remote that has a URL.
+
+    Args:
+        git_config: Path to the .git/config file
+
+    Returns:
+        The remote URL, or None if the file is missing, unreadable or has none
+    """
+    import configparser
+
+    # Git allows repeated keys (e.g. several fetch lines) and valueless boolean
+    # keys (e.g. a bare "bare"), so parse leniently
+    parser = configparser.ConfigParser(strict=False, interpolation=None, allow_no_value=True)
+    try:
+        if not parser.read(git_config, encoding="utf-8"):
+            return None
+    except (configparser.Error, UnicodeDecodeError):
+        return None
+
+    url = parser.get('remote "origin"', "url", fallback=None)
+    if url:
+        return url
+    for section in parser.sections():
+        if section.startswith("remote ") and (url := parser.get(section, "url", fallback=None)):
+            return url
+    return None
+
+
+# validate_config() default for an absent optional list field, so it passes
+# the list check with a single lookup. Never mutated, only type-checked.
+_ABSENT_LIST: list = []
+
+
+# get_config_template() defaults, read once from GeckConfig. Fields with a
+# default_factory (the list fields) get a fresh value on every call instead.
+_CONFIG_DEFAULTS = {
+    field.name: field.default if field.default_factory is MISSING else None
+    for field in fields(GeckConfig)
+}
+_CONFIG_FACTORIES = tuple(
+    (field.name, field.default_factory)
+    for field in fields(GeckConfig)
+    if field.default_factory is not MISSING
+)
+
+
+# generate() results keyed by (llm_init template source, frozen prepared
+# config, date), in least-recently-used order. Keying on the source rather
+# than the engine means a custom llm_init never gets a stale built-in render.
+# The date is part of the key because LLM_init.md embeds today's date by default.
+_GENERATE_CACHE: OrderedDict[Hashable, str] = OrderedDict()
+_GENERATE_CACHE_SIZE = 32
+
+
+def _freeze(value: Any) -> Hashable:
+    """
+    Convert a config value (dicts, lists, sets) into a hashable equivalent.
+
+    Every level is tagged with its type, so values that compare equal but
+    render differently (True/1/1.0, a list and a tuple) get distinct keys.
+    """
+    if isinstance(value, Mapping):
+        items = sorted((_freeze(key), _freeze(item)) for key, item in value.items())
+        return (type(value), tuple(items))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze(item) for item in value))
+    if isinstance(value, (set, frozenset)):
+        return (type(value), frozenset(_freeze(item) for item in value))
+    return (type(value), value)
+
 
-    # Standard list of platforms for env.md
-    ALL_PLATFORMS = ["Windows", "macOS", "Linux", "Docker", "iOS", "Android", "Web"]
+def clear_generate_cache() -> None:
+    """Drop all cached GECKGenerator.generate() results."""
+    _GENERATE_CACHE.clear()
 
-    def __init__(self):
-        """Initialize the generator with template engine and profile manager."""
-        self.template_engine = TemplateEngine()
-        self.profiles = ProfileManager()
 
-    def generate(self, config: dict[str, Any]) -> str:
+class _PreparedConfig(Mapping):
+    """
+    Read-only config returned by GECKGenerator._prepare_config().
+
+    Its type marks it as already prepared, so no marker key has to be added
+    to the config itself (where it would reach templates and cache keys).
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: dict[str, Any]):
+        self._data = data
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._data.get(key, default)
+
+
+class GECKGenerator:
+    """Central class that orchestrates GECK file generation."""
+
+    # Standard platforms for env.md (immutable, shared by every render)
+    ALL_PLATFORMS = ("Windows", "macOS", "Linux", "Docker", "iOS", "Android", "Web")
+
+    @cached_property
+    def template_engine(self) -> "TemplateEngine":
+        """Template engine, created on first use."""
+        # Imported here so generator users that never render skip Jinja2.
+        # Each generator gets its own engine since custom templates are
+        # per-instance; the compiled Jinja2 environment is shared regardless.
+        from geck_generator.core.templates import TemplateEngine
+        return TemplateEngine()
+
+    @cached_property
+    def profiles(self) -> "ProfileManager":
+        """Profile manager, created on first use."""
+        # Imported here so configs without a profile never load the definitions.
+        # Each generator gets its own manager since custom profiles are
+        # per-instance; the built-in tables are shared read-only data regardless.
+        from geck_generator.core.profiles import ProfileManager
+        return ProfileManager()
+
+    def _prepare_config(self, config: Mapping[str, Any] | GeckConfig) -> Mapping[str, Any]:
         """
-        Generate LLM_init.md content from config dict.
+        Apply the selected profile and fill in defaults for required fields.
+
+        The caller's dict is never modified. The result is a read-only
+        _PreparedConfig, so passing it back in returns it unchanged instead
+        of re-applying the profile.
 
         Args:
-            config: Configuration dictionary with project details
+            config: Configuration dictionary or GeckConfig with project details
 
         Returns:
-            Generated LLM_init.md content as string
+            Read-only configuration mapping ready for rendering
         """
-        # Apply profile if specified
-        if "profile" in config and config["profile"]:
+        if isinstance(config, _PreparedConfig):
+            return config
+        if isinstance(config, GeckConfig):
+            config = config.to_dict()
+
+        # Apply profile if specified (apply_profile returns a copy)
+        if config.get("profile"):
             config = self.profiles.apply_profile(config, config["profile"])
+        else:
+            config = config.copy()
 
         # Ensure required fields have defaults
         config.setdefault("project_name", "Untitled Project")
@@ -120,15 +466,50 @@ class GECKGenerator:
         config.setdefault("frameworks", [])
         config.setdefault("platforms", [])
 
+        return _PreparedConfig(config)
+
+    def generate(self, config: dict[str, Any] | GeckConfig) -> str:
+        """
+        Generate LLM_init.md content from config dict.
+
+        Args:
+            config: Configuration dictionary or GeckConfig with project details
+
+        Returns:
+            Generated LLM_init.md content as string
+        """
+        config = self._prepare_config(config)
+
+        # Identical configs (e.g. repeated previews) reuse the last render
+        try:
+            key = (
+                self.template_engine.get_template_source("llm_init"),
+                _freeze(config),
+                time.strftime("%Y-%m-%d"),
+            )
+            hash(key)
+        except TypeError:
+            # Config holds values that can't be frozen; render uncached
+            return self.template_engine.render("llm_init", config)
+
+        content = _GENERATE_CACHE.get(key)
+        if content is not None:
+            _GENERATE_CACHE.move_to_end(key)
+            return content
+
         # Render the template
-        return self.template_engine.render("llm_init", config)
+        content = self.template_engine.render("llm_init", config)
+        _GENERATE_CACHE[key] = content
+        if len(_GENERATE_CACHE) > _GENERATE_CACHE_SIZE:
+            _GENERATE_CACHE.popitem(last=False)
+        return content
 
-    def generate_to_file(self, config: dict[str, Any], output_path: Path | str) -> Path:
+    def generate_to_file(self, config: dict[str, Any] | GeckConfig, output_path: Path | str) -> Path:
         """
         Generate and write LLM_init.md to file.
 
         Args:
-            config: Configuration dictionary with project details
+            config: Configuration dictionary or GeckConfig with project details
             output_path: Path to write the output file
 
         Returns:
@@ -136,21 +517,16 @@ class GECKGenerator:
         """
         output_path = Path(output_path)
 
-        # Create parent directory if needed
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Generate content
+        # Generate content and write it (parent directory created if needed)
         content = self.generate(config)
-
-        # Write to file
-        output_path.write_text(content, encoding="utf-8")
+        _write_output(output_path, content)
 
         return output_path
 
     # Default task that is always included
     DEFAULT_INITIAL_TASK = "Compile task list from log and LLM_init entries"
 
-    def _derive_initial_tasks(self, config: dict) -> list[str]:
+    def _derive_initial_tasks(self, config: Mapping[str, Any]) -> list[str]:
         """
         Derive initial tasks from config (initial_task + success_criteria).
 
@@ -163,21 +539,13 @@ class GECKGenerator:
         Returns:
             List of task strings
         """
-        tasks = []
-
-        # Always include the default task first
-        tasks.append(self.DEFAULT_INITIAL_TASK)
-
-        # Add user's initial task if provided
-        initial_task = config.get("initial_task", "").strip()
-        if initial_task:
+        # Always include the default task first, then the user's initial task
+        tasks = [self.DEFAULT_INITIAL_TASK]
+        if initial_task := (config.get("initial_task") or "").strip():
             tasks.append(initial_task)
 
-        # Add success criteria as tasks
-        for criterion in config.get("success_criteria", []):
-            if criterion.strip():
-                tasks.append(criterion.strip())
-
+        # Add non-empty success criteria as tasks
+        tasks += [task for criterion in config.get("success_criteria", []) if (task := criterion.strip())]
         return tasks
 
     def _parse_goal_to_bullets(self, goal: str) -> list[str]:
@@ -193,26 +561,13 @@ class GECKGenerator:
         if not goal:
             return ["No goal specified"]
 
-        # Split by sentences or newlines
-        bullets = []
-
-        # First try splitting by newlines
-        lines = goal.strip().split("\n")
-        for line in lines:
-            line = line.strip()
-            if line:
-                # Remove leading bullet chars if present
-                line = line.lstrip("-*").strip()
-                if line:
-                    bullets.append(line)
+        # One bullet per non-empty line, minus any leading bullet chars
+        bullets = [text for line in goal.split("\n") if (text := line.strip().lstrip("-*").strip())]
 
         # If no newline splits, use the whole goal
-        if not bullets:
-            bullets.append(goal.strip())
-
-        return bullets
+        return bullets or [goal.strip()]
 
-    def init_geck_folder(self, project_path: Path | str, config: dict[str, Any]) -> Path:
+    def init_geck_folder(self, project_path: Path | str, config: dict[str, Any] | GeckConfig) -> Path:
         """
         Create full GECK folder structure with all files.
 
@@ -225,7 +580,7 @@ class GECKGenerator:
 
         Args:
             project_path: Path to the project root
-            config: Configuration dictionary with project details
+            config: Configuration dictionary or GeckConfig with project details
 
         Returns:
             Path to the created GECK folder
@@ -236,16 +591,7 @@ class GECKGenerator:
         # Create the GECK folder
         geck_folder.mkdir(parents=True, exist_ok=True)
 
-        # Apply profile if specified
-        if "profile" in config and config["profile"]:
-            config = self.profiles.apply_profile(config, config["profile"])
-
-        # Ensure required fields have defaults
-        config.setdefault("project_name", "Untitled Project")
-        config.setdefault("goal", "No goal specified.")
-        config.setdefault("success_criteria", [])
-        config.setdefault("frameworks", [])
-        config.setdefault("platforms", [])
+        config = self._prepare_config(config)
 
         # Detect environment
         env_info = _detect_environment()
@@ -255,45 +601,61 @@ class GECKGenerator:
         initial_tasks = self._derive_initial_tasks(config)
         understood_goals = self._parse_goal_to_bullets(config.get("goal", ""))
 
-        # 1. Write LLM_init.md inside GECK folder
-        init_content = self.template_engine.render("llm_init", config)
-        (geck_folder / "LLM_init.md").write_text(init_content, encoding="utf-8")
-
-        # 2. Write GECK_Inst.md (static template, no variables needed)
-        geck_inst_content = self.template_engine.render("geck_inst", {})
-        (geck_folder / "GECK_Inst.md").write_text(geck_inst_content, encoding="utf-8")
-
-        # 3. Write env.md (with detected environment)
-        env_vars = {
-            "project_name": config["project_name"],
-            "timestamp": timestamp,
-            "os_info": env_info["os_info"],
-            "shell_info": env_info["shell_info"],
-            "runtime_versions": env_info["runtime_versions"],
-            "all_platforms": self.ALL_PLATFORMS,
-            "target_platforms": config.get("platforms", []),
-        }
-        env_content = self.template_engine.render("env", env_vars)
-        (geck_folder / "env.md").write_text(env_content, encoding="utf-8")
-
-        # 4. Write tasks.md (with initial tasks)
-        tasks_vars = {
-            "project_name": config["project_name"],
-            "timestamp": timestamp,
-            "initial_tasks": initial_tasks,
-        }
-        tasks_content = self.template_engine.render("tasks", tasks_vars)
-        (geck_folder / "tasks.md").write_text(tasks_content, encoding="utf-8")
-
-        # 5. Write log.md (Entry #0 format)
-        log_vars = {
-            "project_name": config["project_name"],
-            "timestamp": timestamp,
-            "understood_goals": understood_goals,
-            "initial_tasks": initial_tasks,
-        }
-        log_content = self.template_engine.render("log", log_vars)
-        (geck_folder / "log.md").write_text(log_content, encoding="utf-8")
+        # (filename, template name, template variables) for each GECK file
+        files = [
+            ("LLM_init.md", "llm_init", config),
+            # GECK_Inst.md is static, no variables needed
+            ("GECK_Inst.md", "geck_inst", {}),
+            # env.md with detected environment
+            ("env.md", "env", {
+                "project_name": config["project_name"],
+                "timestamp": timestamp,
+                "os_info": env_info["os_info"],
+                "shell_info": env_info["shell_info"],
+                "runtime_versions": env_info["runtime_versions"],
+                "all_platforms": self.ALL_PLATFORMS,
+                "target_platforms": config.get("platforms", []),
+            }),
+            # tasks.md with initial tasks
+            ("tasks.md", "tasks", {
+                "project_name": config["project_name"],
+                "timestamp": timestamp,
+                "initial_tasks": initial_tasks,
+            }),
+            # log.md in Entry #0 format
+            ("log.md", "log", {
+                "project_name": config["project_name"],
+                "timestamp": timestamp,
+                "understood_goals": understood_goals,
+                "initial_tasks": initial_tasks,
+            }),
+        ]
+
+        # Hand each file to a writer thread as soon as it's rendered, so
+        # rendering the next file overlaps the previous write (writes release
+        # the GIL while blocked on I/O). Files whose content is unchanged
+        # since the last run are skipped.
+        render = self.template_engine.render
+        manifest = _load_manifest(geck_folder)
+        with ThreadPoolExecutor(max_workers=len(files)) as executor:
+            futures = {
+                filename: executor.submit(
+                    _write_if_changed,
+                    geck_folder / filename,
+                    _encode_text(render(template_name, variables)),
+                    manifest.get(filename),
+                )
+                for filename, template_name, variables in files
+            }
+        # result() re-raises any write error here
+        written = {filename: future.result() for filename, future in futures.items()}
+
+        updates = {filename: entry for filename, entry in written.items() if entry}
+        if updates:
+            import json
+
+            manifest.update(updates)
+            _write_bytes(geck_folder / _MANIFEST_NAME, json.dumps(manifest, indent=2).encode("utf-8"))
 
         return geck_folder
 
@@ -324,8 +686,9 @@ class GECKGenerator:
 
         content = self.generate(config)
 
+        # Write the content already rendered instead of generating it again
         if output_path:
-            self.generate_to_file(config, output_path)
+            _write_output(Path(output_path), content)
 
         return content
 
@@ -351,27 +714,36 @@ class GECKGenerator:
         # Load the template
         template_content = template_path.read_text(encoding="utf-8")
 
-        # Render
         content = self.template_engine.render_string(template_content, variables)
 
-        # Write if output path provided
+        # Written only once rendering has succeeded, so a template error
+        # leaves any existing output file untouched
         if output_path:
-            output_path = Path(output_path)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_text(content, encoding="utf-8")
+            _write_output(Path(output_path), content)
 
         return content
 
-    def validate_config(self, config: dict[str, Any]) -> list[str]:
+    def validate_config(self, config: dict[str, Any] | GeckConfig) -> list[str]:
         """
         Validate a configuration dictionary.
 
         Args:
-            config: Configuration to validate
+            config: Configuration dictionary or GeckConfig to validate
 
         Returns:
             List of validation error messages (empty if valid)
         """
+        # Plain dicts are the common case; skip the isinstance() check for them
+        if type(config) is not dict and isinstance(config, GeckConfig):
+            # Copy just the checked fields; to_dict() would deep-copy every list
+            config = {
+                "project_name": config.project_name,
+                "goal": config.goal,
+                "profile": config.profile,
+                "success_criteria": config.success_criteria,
+                "platforms": config.platforms,
+            }
+
         errors = []
 
         # Check required fields
@@ -382,21 +754,19 @@ class GECKGenerator:
             errors.append("Project goal is required")
 
         # Check profile if specified
-        if config.get("profile"):
-            try:
-                self.profiles.get_profile(config["profile"])
-            except KeyError as e:
-                errors.append(str(e))
+        profile = config.get("profile")
+        if profile and profile not in self.profiles.known_profile_names:
+            errors.append(
+                f"Profile '{profile}' not found. Available: {list(self.profiles.list_profiles())}"
+            )
 
         # Validate success criteria is a list
-        if "success_criteria" in config:
-            if not isinstance(config["success_criteria"], list):
-                errors.append("Success criteria must be a list")
+        if not isinstance(config.get("success_criteria", _ABSENT_LIST), list):
+            errors.append("Success criteria must be a list")
 
         # Validate platforms is a list
-        if "platforms" in config:
-            if not isinstance(config["platforms"], list):
-                errors.append("Platforms must be a list")
+        if not isinstance(config.get("platforms", _ABSENT_LIST), list):
+            errors.append("Platforms must be a list")
 
         return errors
 
@@ -407,22 +777,10 @@ class GECKGenerator:
         Returns:
             Dictionary with all config fields set to empty/default values
         """
-        return {
-            "project_name": "",
-            "repo_url": "",
-            "local_path": "",
-            "profile": None,
-            "goal": "",
-            "success_criteria": [],
-            "languages": "",
-            "frameworks": [],
-            "must_use": "",
-            "must_avoid": "",
-            "platforms": [],
-            "context": "",
-            "initial_task": "",
-            "git_branch": None,
-        }
+        template = _CONFIG_DEFAULTS.copy()
+        for name, factory in _CONFIG_FACTORIES:
+            template[name] = factory()
+        return template
 
     def generate_repor_instructions(
         self,
@@ -454,35 +812,20 @@ class GECKGenerator:
         geck_folder = working_directory / "GECK"
 
         # Check for existing git repo in working directory
-        project_git_repo = None
-        git_config = working_directory / ".git" / "config"
-        if git_config.exists():
-            try:
-                config_text = git_config.read_text(encoding="utf-8")
-                # Parse remote URL from git config
-                for line in config_text.split("\n"):
-                    line = line.strip()
-                    if line.startswith("url = "):
-                        project_git_repo = line[6:].strip()
-                        break
-            except Exception:
-                pass
+        project_git_repo = _read_git_remote_url(working_directory / ".git" / "config")
 
         # Combine profile goals with custom goals
         all_goals = []
         if profile_name and profile_name != "none":
-            repor_profiles = ReporProfileManager()
+            from geck_generator.core.profiles import get_repor_profile_manager
+
+            repor_profiles = get_repor_profile_manager()
             profile_goals = repor_profiles.get_goals_for_profile(profile_name)
             all_goals.extend(profile_goals)
         all_goals.extend(exploration_goals)
 
         # Remove duplicates while preserving order
-        seen = set()
-        unique_goals = []
-        for goal in all_goals:
-            if goal not in seen:
-                seen.add(goal)
-                unique_goals.append(goal)
+        unique_goals = list(dict.fromkeys(all_goals))
 
         # Prepare template variables
         template_vars = {
@@ -499,8 +842,6 @@ class GECKGenerator:
 
         # Write to file if output path provided
         if output_path:
-            output_path = Path(output_path)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_text(content, encoding="utf-8")
+            _write_output(Path(output_path), content)
 
         return content
@@ -1,5 +1,9 @@
 """Preset profile definitions for GECK Generator."""
 
+from collections import ChainMap
+from collections.abc import Iterator, Mapping
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
 
@@ -8,96 +12,116 @@ REPOR_PROFILES: dict[str, dict[str, Any]] = {
     "feature_discovery": {
         "name": "Feature Discovery",
         "description": "Find reusable components and patterns",
-        "goals": [
+        "goals": (
             "Identify reusable utility functions",
             "Find well-documented APIs",
             "Locate configurable components",
             "Discover extensible patterns",
-        ],
+        ),
     },
     "performance_optimization": {
         "name": "Performance Optimization",
         "description": "Identify performance patterns",
-        "goals": [
+        "goals": (
             "Find caching implementations",
             "Locate async/concurrent patterns",
             "Identify optimization techniques",
             "Discover efficient algorithms",
-        ],
+        ),
     },
     "security_audit": {
         "name": "Security Audit",
         "description": "Look for security patterns and practices",
-        "goals": [
+        "goals": (
             "Find authentication implementations",
             "Locate input validation patterns",
             "Identify secure configuration practices",
             "Discover access control mechanisms",
-        ],
+        ),
     },
     "testing_patterns": {
         "name": "Testing Patterns",
         "description": "Find testing strategies and coverage",
-        "goals": [
+        "goals": (
             "Identify testing frameworks used",
             "Find mock/stub patterns",
             "Locate integration test setups",
             "Discover test organization patterns",
-        ],
+        ),
     },
     "architecture_review": {
         "name": "Architecture Review",
         "description": "Analyze code organization",
-        "goals": [
+        "goals": (
             "Identify architectural patterns (MVC, etc.)",
             "Find module organization patterns",
             "Locate dependency injection usage",
             "Discover error handling strategies",
-        ],
+        ),
     },
 }
 
+# Repor profile dropdown choices: (key, display_name, description), with the
+# "no profile" option first
+REPOR_CHOICES: tuple[tuple[str, str, str], ...] = (
+    ("none", "Custom / No Profile", "Enter your own exploration goals"),
+    *((key, profile["name"], profile.get("description", "")) for key, profile in REPOR_PROFILES.items()),
+)
+
 
 # Profile categories for organized menu navigation
-# Each category contains a list of profile keys
+# Each category contains a tuple of profile keys
 PROFILE_CATEGORIES: dict[str, dict[str, Any]] = {
     "web": {
         "name": "Web & Internet",
         "description": "Websites, web applications, APIs, and browser extensions",
-        "profiles": ["website", "web_app", "api", "browser_extension"],
+        "profiles": ("website", "web_app", "api", "browser_extension"),
     },
     "applications": {
         "name": "Applications",
         "description": "Desktop, mobile, and command-line applications",
-        "profiles": ["desktop_app", "mobile_app", "cli_tool"],
+        "profiles": ("desktop_app", "mobile_app", "cli_tool"),
     },
     "automation": {
         "name": "Automation & Infrastructure",
         "description": "Scripts, DevOps, bots, and infrastructure as code",
-        "profiles": ["automation_script", "devops", "bot"],
+        "profiles": ("automation_script", "devops", "bot"),
     },
     "libraries": {
         "name": "Libraries & Services",
         "description": "Reusable packages, plugins, and microservices",
-        "profiles": ["library", "plugin", "microservice"],
+        "profiles": ("library", "plugin", "microservice"),
     },
     "data": {
         "name": "Data & Documents",
         "description": "Data science, spreadsheets, and documentation",
-        "profiles": ["data_science", "excel_sheets", "documentation"],
+        "profiles": ("data_science", "excel_sheets", "documentation"),
     },
     "creative": {
         "name": "Creative & Games",
         "description": "Games, graphics, and creative coding",
-        "profiles": ["game", "shader_creative"],
+        "profiles": ("game", "shader_creative"),
     },
     "systems": {
         "name": "Systems & Hardware",
         "description": "OS development, embedded systems, and blockchain",
-        "profiles": ["os_development", "embedded", "blockchain"],
+        "profiles": ("os_development", "embedded", "blockchain"),
     },
 }
 
+# Reverse index, profile key -> category key, for get_category_for_profile()
+_PROFILE_TO_CATEGORY: dict[str, str] = {
+    profile_key: cat_key
+    for cat_key, category in PROFILE_CATEGORIES.items()
+    for profile_key in category["profiles"]
+}
+
+
+# Platform sets shared by several profiles. Like every sequence field in the
+# built-in profiles these are tuples, so they can be shared safely.
+_PLATFORMS_DESKTOP = ("Linux", "Windows", "macOS")
+_PLATFORMS_WEB_SERVICE = ("Web", "Linux", "Docker")
+
 
 # Preset profiles for common project types
 PROFILES: dict[str, dict[str, Any]] = {
@@ -106,19 +130,19 @@ PROFILES: dict[str, dict[str, Any]] = {
         "name": "Website",
         "description": "Static or dynamic website focused on content delivery",
         "languages": "HTML, CSS, JavaScript/TypeScript",
-        "frameworks": [
+        "frameworks": (
             "Astro", "Hugo", "Eleventy", "Jekyll", "Next.js", "Nuxt",
             "WordPress", "Tailwind CSS", "Bootstrap"
-        ],
-        "platforms": ["Web", "Linux", "Docker"],
-        "suggested_criteria": [
+        ),
+        "platforms": _PLATFORMS_WEB_SERVICE,
+        "suggested_criteria": (
             "All pages render correctly across browsers",
             "Site is responsive on mobile, tablet, and desktop",
             "Accessibility audit passes (WCAG 2.1 AA)",
             "Page load time meets performance targets",
             "SEO fundamentals are implemented correctly",
             "All links and navigation work correctly",
-        ],
+        ),
         "suggested_must_use": "Semantic HTML, responsive design, image optimization, meta tags",
         "suggested_must_avoid": "Inline styles for layout, blocking scripts in head, missing alt text, broken links",
     },
@@ -126,19 +150,19 @@ PROFILES: dict[str, dict[str, Any]] = {
         "name": "Web App",
         "description": "Interactive browser-based application or SaaS tool",
         "languages": "JavaScript/TypeScript, Python 3.11+",
-        "frameworks": [
+        "frameworks": (
             "React", "Vue", "Svelte", "Angular", "SolidJS",
             "Next.js", "Nuxt", "SvelteKit", "Redux", "Zustand"
-        ],
-        "platforms": ["Web", "Linux", "Windows", "macOS", "Docker"],
-        "suggested_criteria": [
+        ),
+        "platforms": ("Web", "Linux", "Windows", "macOS", "Docker"),
+        "suggested_criteria": (
             "Application loads and initializes without errors",
             "User interactions respond correctly",
             "State management works across components",
             "Data persists correctly (local storage, backend)",
             "Application handles offline/error states gracefully",
             "Authentication and session management work correctly",
-        ],
+        ),
         "suggested_must_use": "Component architecture, state management, error boundaries, loading states",
         "suggested_must_avoid": "Direct DOM manipulation in frameworks, prop drilling, memory leaks in subscriptions, exposing sensitive data client-side",
     },
@@ -146,19 +170,19 @@ PROFILES: dict[str, dict[str, Any]] = {
         "name": "API",
         "description": "REST, GraphQL, or gRPC API service",
         "languages": "Python 3.11+, TypeScript/Node.js, Go, Rust",
-        "frameworks": [
+        "frameworks": (
             "FastAPI", "Flask", "Django REST Framework", "Express",
             "NestJS", "Hono", "GraphQL", "gRPC", "tRPC"
-        ],
-        "platforms": ["Linux", "Docker", "Kubernetes"],
-        "suggested_criteria": [
+        ),
+        "platforms": ("Linux", "Docker", "Kubernetes"),
+        "suggested_criteria": (
             "All endpoints respond with correct status codes",
             "Request validation rejects malformed input",
             "Authentication and authorization work correctly",
             "Rate limiting protects against abuse",
             "API documentation is accurate and complete",
             "Error responses are consistent and informative",
-        ],
+        ),
         "suggested_must_use": "OpenAPI/Swagger documentation, proper HTTP methods and status codes, request validation, structured logging",
         "suggested_must_avoid": "SQL injection, exposing stack traces in production, missing authentication on protected routes, N+1 query problems",
     },
@@ -166,19 +190,19 @@ PROFILES: dict[str, dict[str, Any]] = {
         "name": "Browser Extension",
         "description": "Chrome, Firefox, Safari, or Edge browser extension",
         "languages": "JavaScript/TypeScript, HTML, CSS",
-        "frameworks": [
+        "frameworks": (
             "WebExtensions API", "Chrome Extensions API", "Plasmo", "WXT",
             "Chrome Storage API", "Browser Action API"
-        ],
-        "platforms": ["Chrome", "Firefox", "Safari", "Edge"],
-        "suggested_criteria": [
+        ),
+        "platforms": ("Chrome", "Firefox", "Safari", "Edge"),
+        "suggested_criteria": (
             "Extension installs without errors",
             "Permissions are minimal and justified",
             "Content scripts work on target pages",
             "Background/service worker handles events correctly",
             "Popup and options UI work correctly",
             "Extension passes store review guidelines",
-        ],
+        ),
         "suggested_must_use": "Manifest V3 (Chrome), minimal permission scoping, content security policy, proper message passing",
         "suggested_must_avoid": "Excessive permissions, remote code execution, data collection without consent, blocking the main thread",
     },
@@ -187,19 +211,19 @@ PROFILES: dict[str, dict[str, Any]] = {
         "name": "Desktop Application",
         "description": "Native or cross-platform desktop application",
         "languages": "JavaScript/TypeScript, Rust, C++, C#, Python",
-        "frameworks": [
+        "frameworks": (
             "Electron", "Tauri", "Qt", "WPF", "WinForms",
             "GTK", "PyQt", "wxWidgets", ".NET MAUI"
-        ],
-        "platforms": ["Windows", "macOS", "Linux"],
-        "suggested_criteria": [
+        ),
+        "platforms": ("Windows", "macOS", "Linux"),
+        "suggested_criteria": (
             "Application launches and displays correctly",
             "Window management works properly",
             "File operations complete correctly",
             "System integration works (tray, notifications, file associations)",
             "Application handles multiple monitors and DPI scaling",
             "Installation and updates work correctly",
-        ],
+        ),
         "suggested_must_use": "Native platform conventions, proper window lifecycle, system theme support, accessible UI",
         "suggested_must_avoid": "Excessive resource usage, blocking UI thread, platform-specific code without abstraction",
     },
@@ -207,19 +231,19 @@ PROFILES: dict[str, dict[str, Any]] = {
         "name": "Mobile Application",
         "description": "iOS, Android, or cross-platform mobile app",
         "languages": "Swift, Kotlin, Dart, JavaScript/TypeScript, C#",
-        "frameworks": [
+        "frameworks": (
             "SwiftUI", "UIKit", "Jetpack Compose", "Flutter",
             "React Native", "Expo", ".NET MAUI", "Capacitor"
-        ],
-        "platforms": ["iOS", "Android"],
-        "suggested_criteria": [
+        ),
+        "platforms": ("iOS", "Android"),
+        "suggested_criteria": (
             "App launches without crashes",
             "UI renders correctly across screen sizes",
             "Navigation flows work correctly",
             "Data persists correctly across app restarts",
             "App handles background/foreground transitions",
             "Push notifications work correctly (if applicable)",
-        ],
+        ),
         "suggested_must_use": "Platform design guidelines (HIG/Material), responsive layouts, proper lifecycle handling, accessibility",
         "suggested_must_avoid": "Blocking main/UI thread, excessive battery/memory usage, hardcoded dimensions, ignoring safe areas",
     },
@@ -227,15 +251,15 @@ PROFILES: dict[str, dict[str, Any]] = {
         "name": "CLI Tool",
         "description": "Command-line interface application",
         "languages": "Python 3.11+",
-        "frameworks": ["Click", "Typer", "argparse"],
-        "platforms": ["Linux", "Windows", "macOS"],
-        "suggested_criteria": [
+        "frameworks": ("Click", "Typer", "argparse"),
+        "platforms": _PLATFORMS_DESKTOP,
+        "suggested_criteria": (
             "All commands execute without errors",
             "Help text is accurate and complete",
             "Exit codes are correct",
             "Input validation works properly",
             "Error messages are clear and actionable",
-        ],
+        ),
         "suggested_must_use": "Type hints, proper exit codes",
         "suggested_must_avoid": "Hardcoded paths, platform-specific assumptions",
     },
@@ -244,15 +268,15 @@ PROFILES: dict[str, dict[str, Any]] = {
         "name": "Data Science / ML",
         "description": "Data analysis, machine learning, or AI project",
         "languages": "Python 3.11+",
-        "frameworks": ["pandas", "numpy", "scikit-learn", "pytorch", "tensorflow"],
-        "platforms": ["Linux", "Windows", "macOS"],
-        "suggested_criteria": [
+        "frameworks": ("pandas", "numpy", "scikit-learn", "pytorch", "tensorflow"),
+        "platforms": _PLATFORMS_DESKTOP,
+        "suggested_criteria": (
             "Data pipeline runs end-to-end",
             "Model achieves target metrics",
             "Results are reproducible",
             "Data preprocessing handles edge cases",
             "Visualizations render correctly",
-        ],
+        ),
         "suggested_must_use": "Virtual environments, requirements.txt or pyproject.toml",
         "suggested_must_avoid": "Absolute paths to data, training on test data",
     },
@@ -261,15 +285,15 @@ PROFILES: dict[str, dict[str, Any]] = {
         "name": "Automation Script",
         "description": "Scripts for task automation and batch processing",
         "languages": "Python 3.11+, Bash, PowerShell",
-        "frameworks": [],
-        "platforms": ["Linux", "Windows", "macOS"],
-        "suggested_criteria": [
+        "frameworks": (),
+        "platforms": _PLATFORMS_DESKTOP,
+        "suggested_criteria": (
             "Script completes without errors",
             "Output is in expected format",
             "Edge cases are handled",
             "Logging provides useful information",
             "Script is idempotent where appropriate",
-        ],
+        ),
         "suggested_must_use": "Logging, error handling, clear documentation",
         "suggested_must_avoid": "Destructive operations without confirmation, hardcoded secrets",
     },
@@ -277,19 +301,19 @@ PROFILES: dict[str, dict[str, Any]] = {
         "name": "DevOps / Infrastructure",
         "description": "Infrastructure as Code, CI/CD, and cloud automation",
         "languages": "HCL, YAML, Python, Bash, Go",
-        "frameworks": [
+        "frameworks": (
             "Terraform", "Ansible", "Pulumi", "CloudFormation",
             "Kubernetes", "Docker", "GitHub Actions", "GitLab CI", "ArgoCD"
-        ],
-        "platforms": ["AWS", "GCP", "Azure", "Linux", "Docker", "Kubernetes"],
-        "suggested_criteria": [
+        ),
+        "platforms": ("AWS", "GCP", "Azure", "Linux", "Docker", "Kubernetes"),
+        "suggested_criteria": (
             "Infrastructure deploys successfully",
             "Configuration changes are idempotent",
             "Secrets are managed securely",
             "Rollback procedures work correctly",
             "Monitoring and alerting are configured",
             "CI/CD pipelines run successfully",
-        ],
+        ),
         "suggested_must_use": "Infrastructure as Code, version control for configs, secret management (Vault, etc.), least privilege IAM",
         "suggested_must_avoid": "Hardcoded credentials, manual configuration drift, single points of failure, over-provisioned resources",
     },
@@ -297,19 +321,19 @@ PROFILES: dict[str, dict[str, Any]] = {
         "name": "Chat Bot / Integration",
         "description": "Discord, Slack, Telegram, or other chat platform bot",
         "languages": "Python, JavaScript/TypeScript, Go",
-        "frameworks": [
+        "frameworks": (
             "discord.py", "discord.js", "Slack Bolt", "python-telegram-bot",
             "Telegraf", "Pycord", "Nextcord"
-        ],
-        "platforms": ["Discord", "Slack", "Telegram", "Linux", "Docker"],
-        "suggested_criteria": [
+        ),
+        "platforms": ("Discord", "Slack", "Telegram", "Linux", "Docker"),
+        "suggested_criteria": (
             "Bot connects and authenticates successfully",
             "Commands respond correctly",
             "Rate limiting is handled properly",
             "Permissions are respected",
             "Error responses are user-friendly",
             "Bot reconnects gracefully after disconnection",
-        ],
+        ),
         "suggested_must_use": "Command framework, proper rate limit handling, graceful shutdown, logging, /help command",
         "suggested_must_avoid": "Blocking event loop, tokens in source code, excessive API calls, ignoring platform ToS",
     },
@@ -318,15 +342,15 @@ PROFILES: dict[str, dict[str, Any]] = {
         "name": "Library / Package",
         "description": "Reusable library or package for any language",
         "languages": "Python 3.11+, TypeScript, Rust, Go",
-        "frameworks": [],
-        "platforms": ["Linux", "Windows", "macOS"],
-        "suggested_criteria": [
+        "frameworks": (),
+        "platforms": _PLATFORMS_DESKTOP,
+        "suggested_criteria": (
             "All public APIs have documentation",
             "Unit tests pass with good coverage",
             "Package installs correctly via package manager",
             "Type definitions are complete and accurate",
             "README and docs are clear and complete",
-        ],
+        ),
         "suggested_must_use": "Type hints/definitions, docstrings, semantic versioning, proper package manifest",
         "suggested_must_avoid": "Breaking changes without major version bump, circular dependencies, excessive dependencies",
     },
@@ -334,19 +358,19 @@ PROFILES: dict[str, dict[str, Any]] = {
         "name": "Plugin / Extension",
         "description": "Plugin or extension for an existing application",
         "languages": "JavaScript/TypeScript, Python, Lua, C#, PHP",
-        "frameworks": [
+        "frameworks": (
             "VSCode Extension API", "JetBrains Plugin SDK", "Obsidian Plugin API",
             "WordPress Plugin API", "Neovim Lua API", "Unity Editor API"
-        ],
-        "platforms": ["Windows", "macOS", "Linux", "Web"],
-        "suggested_criteria": [
+        ),
+        "platforms": ("Windows", "macOS", "Linux", "Web"),
+        "suggested_criteria": (
             "Plugin installs without errors",
             "Plugin integrates with host API correctly",
             "Settings and configuration work properly",
             "Plugin doesn't break host application",
             "Uninstall cleans up properly",
             "Documentation explains usage clearly",
-        ],
+        ),
         "suggested_must_use": "Host application's API conventions, proper lifecycle hooks, settings persistence, error boundaries",
         "suggested_must_avoid": "Global namespace pollution, modifying host internals, excessive resource usage, breaking other plugins",
     },
@@ -354,15 +378,15 @@ PROFILES: dict[str, dict[str, Any]] = {
         "name": "Microservice",
         "description": "Containerized microservice for distributed systems",
         "languages": "Python 3.11+",
-        "frameworks": ["FastAPI", "Flask", "gRPC"],
-        "platforms": ["Docker", "Kubernetes"],
-        "suggested_criteria": [
+        "frameworks": ("FastAPI", "Flask", "gRPC"),
+        "platforms": ("Docker", "Kubernetes"),
+        "suggested_criteria": (
             "Service starts and responds to health checks",
             "All endpoints function correctly",
             "Service handles failures gracefully",
             "Logging and metrics are properly configured",
             "Container builds and runs successfully",
-        ],
+        ),
         "suggested_must_use": "Health check endpoints, structured logging, environment variables for config",
         "suggested_must_avoid": "Storing state locally, hardcoded service URLs",
     },
@@ -370,20 +394,20 @@ PROFILES: dict[str, dict[str, Any]] = {
         "name": "Excel / Sheets Template",
         "description": "Spreadsheet-based applications with macros, formulas, and automation",
         "languages": "VBA, Power Query (M), Google Apps Script, Python, LibreOffice Basic",
-        "frameworks": [
+        "frameworks": (
             "Excel VBA", "Power Query", "Power Pivot", "Office.js",
             "Google Apps Script", "Google Sheets API",
             "LibreOffice Calc", "openpyxl", "xlwings"
-        ],
-        "platforms": ["Windows", "macOS", "Web", "Linux"],
-        "suggested_criteria": [
+        ),
+        "platforms": ("Windows", "macOS", "Web", "Linux"),
+        "suggested_criteria": (
             "All formulas calculate correctly",
             "Macros/scripts execute without errors",
             "Data validation rules work as expected",
             "Template works across target platforms (Excel/Sheets/Calc)",
             "Large datasets perform within acceptable time",
             "Error handling provides clear user feedback",
-        ],
+        ),
         "suggested_must_use": "Named ranges, data validation, error handling in formulas (IFERROR), clear documentation/instructions sheet",
         "suggested_must_avoid": "Volatile functions unnecessarily (INDIRECT, OFFSET), circular references, hardcoded ranges in macros, unprotected sensitive data",
     },
@@ -391,19 +415,19 @@ PROFILES: dict[str, dict[str, Any]] = {
         "name": "Documentation Site",
         "description": "Technical documentation, API docs, or knowledge base",
         "languages": "Markdown, MDX, reStructuredText, HTML",
-        "frameworks": [
+        "frameworks": (
             "Docusaurus", "MkDocs", "Sphinx", "VitePress",
             "Astro", "GitBook", "ReadTheDocs", "Nextra"
-        ],
-        "platforms": ["Web", "Linux", "Docker"],
-        "suggested_criteria": [
+        ),
+        "platforms": _PLATFORMS_WEB_SERVICE,
+        "suggested_criteria": (
             "Site builds without errors",
             "Navigation is logical and complete",
             "Search works correctly",
             "Code examples are accurate and tested",
             "Images and diagrams render correctly",
             "Versioning works correctly (if applicable)",
-        ],
+        ),
         "suggested_must_use": "Consistent formatting, clear heading hierarchy, working links, code syntax highlighting, table of contents",
         "suggested_must_avoid": "Outdated information, broken links, untested code examples, inconsistent terminology, missing search",
     },
@@ -412,16 +436,16 @@ PROFILES: dict[str, dict[str, Any]] = {
         "name": "Game Development",
         "description": "Video game or interactive entertainment project",
         "languages": "Python, C#, C++, GDScript, Lua",
-        "frameworks": ["Pygame", "Godot", "Unity", "Unreal Engine", "Phaser", "LÖVE"],
-        "platforms": ["Windows", "macOS", "Linux", "Web", "iOS", "Android"],
-        "suggested_criteria": [
+        "frameworks": ("Pygame", "Godot", "Unity", "Unreal Engine", "Phaser", "LÖVE"),
+        "platforms": ("Windows", "macOS", "Linux", "Web", "iOS", "Android"),
+        "suggested_criteria": (
             "Game launches without errors",
             "Core gameplay loop functions correctly",
             "Player input is responsive and accurate",
             "Game state saves and loads correctly",
             "Performance meets target frame rate",
             "Audio plays correctly and synchronizes with visuals",
-        ],
+        ),
         "suggested_must_use": "Delta time for frame-independent movement, asset management, input abstraction layer",
         "suggested_must_avoid": "Frame-rate dependent physics, blocking operations in game loop, memory leaks in asset loading",
     },
@@ -429,19 +453,19 @@ PROFILES: dict[str, dict[str, Any]] = {
         "name": "Shader / Creative Coding",
         "description": "Graphics programming, shaders, generative art, or creative coding",
         "languages": "GLSL, HLSL, WGSL, JavaScript, Python, Processing",
-        "frameworks": [
+        "frameworks": (
             "Three.js", "p5.js", "Processing", "OpenGL", "WebGL",
             "WebGPU", "Shadertoy", "TouchDesigner", "OpenFrameworks"
-        ],
-        "platforms": ["Web", "Windows", "macOS", "Linux"],
-        "suggested_criteria": [
+        ),
+        "platforms": ("Web", "Windows", "macOS", "Linux"),
+        "suggested_criteria": (
             "Visuals render correctly",
             "Performance meets target frame rate",
             "Shaders compile without errors",
             "Parameters and uniforms work correctly",
             "Works across target GPUs/browsers",
             "Graceful fallback for unsupported hardware",
-        ],
+        ),
         "suggested_must_use": "GPU-efficient algorithms, proper uniform handling, responsive canvas sizing, requestAnimationFrame",
         "suggested_must_avoid": "Infinite loops in shaders, excessive texture samples, division by zero, GPU memory leaks",
     },
@@ -450,16 +474,16 @@ PROFILES: dict[str, dict[str, Any]] = {
         "name": "OS / Systems Development",
         "description": "Operating system, kernel, driver, or low-level systems programming",
         "languages": "C, C++, Rust, Assembly",
-        "frameworks": ["UEFI", "GRUB", "Limine", "seL4", "Zephyr RTOS"],
-        "platforms": ["Linux", "Windows", "macOS", "Custom/Bare Metal"],
-        "suggested_criteria": [
+        "frameworks": ("UEFI", "GRUB", "Limine", "seL4", "Zephyr RTOS"),
+        "platforms": ("Linux", "Windows", "macOS", "Custom/Bare Metal"),
+        "suggested_criteria": (
             "Kernel boots successfully on target hardware/emulator",
             "Memory management operates correctly without leaks",
             "Interrupt handlers respond within timing requirements",
             "System calls function correctly",
             "Hardware drivers initialize and operate properly",
             "System remains stable under load",
-        ],
+        ),
         "suggested_must_use": "Memory-safe patterns, proper synchronization primitives, hardware abstraction layers",
         "suggested_must_avoid": "Undefined behavior, unhandled interrupts, unbounded loops in kernel space, memory corruption",
     },
@@ -467,7 +491,7 @@ PROFILES: dict[str, dict[str, Any]] = {
         "name": "Embedded / Maker",
         "description": "Arduino, Raspberry Pi, Jetson, ESP32, or other dev board projects",
         "languages": "C, C++ (Arduino), Python, MicroPython, CircuitPython, Rust (embedded-hal)",
-        "frameworks": [
+        "frameworks": (
             # Core embedded frameworks
             "Arduino", "PlatformIO", "ESP-IDF", "Zephyr RTOS", "FreeRTOS",
             # Rust embedded
@@ -478,14 +502,14 @@ PROFILES: dict[str, dict[str, Any]] = {
             "TensorFlow Lite", "Edge Impulse", "TinyML",
             # Other
             "Raspberry Pi OS", "Pico SDK",
-        ],
-        "platforms": [
+        ),
+        "platforms": (
             "Arduino", "ESP32", "ESP8266", "STM32",
             "Raspberry Pi", "Raspberry Pi Pico (RP2040)",
             "NVIDIA Jetson (Nano, Orin, Thor)",
             "Nordic nRF52", "Teensy", "Linux",
-        ],
-        "suggested_criteria": [
+        ),
+        "suggested_criteria": (
             "Firmware compiles and uploads successfully",
             "Hardware peripherals initialize correctly",
             "Sensor readings are accurate within tolerance",
@@ -493,7 +517,7 @@ PROFILES: dict[str, dict[str, Any]] = {
             "Power consumption meets requirements",
             "System recovers gracefully from errors",
             "AI inference runs within latency/memory targets (if applicable)",
-        ],
+        ),
         "suggested_must_use": "Watchdog timers, proper pin initialization, interrupt-safe code, hardware abstraction layers, RTOS tasks for concurrency",
         "suggested_must_avoid": "Blocking delays in critical loops, floating/uninitialized inputs, unbounded memory allocation, ignoring hardware errata, busy-waiting when DMA/interrupts available, baud rate mismatches",
     },
@@ -501,32 +525,157 @@ PROFILES: dict[str, dict[str, Any]] = {
         "name": "Blockchain / DeFi",
         "description": "Cryptocurrency, smart contracts, or decentralized application development",
         "languages": "Solidity, Rust, Python, TypeScript, Move",
-        "frameworks": ["Hardhat", "Foundry", "Anchor", "ethers.js", "web3.py", "OpenZeppelin"],
-        "platforms": ["Ethereum", "Solana", "Polygon", "Arbitrum", "Linux", "Docker"],
-        "suggested_criteria": [
+        "frameworks": ("Hardhat", "Foundry", "Anchor", "ethers.js", "web3.py", "OpenZeppelin"),
+        "platforms": ("Ethereum", "Solana", "Polygon", "Arbitrum", "Linux", "Docker"),
+        "suggested_criteria": (
             "Smart contracts compile without errors",
             "All contract tests pass",
             "No reentrancy vulnerabilities detected",
             "Gas optimization meets targets",
             "Contract upgrades work correctly",
             "Integration with wallets functions properly",
-        ],
+        ),
         "suggested_must_use": "Audited libraries (OpenZeppelin), comprehensive test coverage, formal verification where possible",
         "suggested_must_avoid": "Reentrancy patterns, unchecked external calls, floating pragma versions, storing sensitive data on-chain",
     },
 }
 
+# Menu metadata for each built-in profile, key -> (display_name, description),
+# so listings don't have to touch the full profile bodies. Built once at
+# import since PROFILES never changes.
+PROFILE_INDEX: dict[str, tuple[str, str]] = {
+    key: (profile["name"], profile.get("description", ""))
+    for key, profile in PROFILES.items()
+}
+
+# (key, display_name, description) for each built-in profile
+PROFILE_CHOICES: tuple[tuple[str, str, str], ...] = tuple(
+    (key, name, description) for key, (name, description) in PROFILE_INDEX.items()
+)
+
+
+def _profile_meta(key: str, profile: Mapping[str, Any]) -> dict[str, str]:
+    """Build the metadata entries apply_profile() adds to a config."""
+    return {"_profile_name": key, "_profile_display_name": profile.get("name", key)}
+
+
+@lru_cache(maxsize=256)
+def _default_display_name(key: str) -> str:
+    """Derive a display name from a profile key, e.g. 'my_tool' -> 'My Tool'."""
+    return key.replace("_", " ").title()
+
+
+# apply_profile() metadata for each built-in profile, built once at import
+_PROFILE_META: dict[str, dict[str, str]] = {
+    key: _profile_meta(key, profile) for key, profile in PROFILES.items()
+}
+
+# Marks a field absent from a profile (a present field may hold any value)
+_MISSING = object()
+
+# (profile field, config field) pairs that apply_profile() copies into a config
+_PROFILE_FIELD_MAP: tuple[tuple[str, str], ...] = (
+    ("languages", "languages"),
+    ("frameworks", "frameworks"),
+    ("platforms", "platforms"),
+    ("suggested_criteria", "success_criteria"),
+    ("suggested_must_use", "must_use"),
+    ("suggested_must_avoid", "must_avoid"),
+)
+
+# Read-only views of the built-in definitions, shared by every manager
+# instead of copying the dicts per instance. Each profile is wrapped too, so
+# getters can hand them out without callers needing defensive copies.
+_PROFILES_RO = MappingProxyType({key: MappingProxyType(profile) for key, profile in PROFILES.items()})
+_PROFILE_CATEGORIES_RO = MappingProxyType(
+    {key: MappingProxyType(category) for key, category in PROFILE_CATEGORIES.items()}
+)
+
+# (profile_key, display_name, description) for each category's profiles,
+# for get_profiles_for_category()
+_CATEGORY_PROFILE_CHOICES: dict[str, tuple[tuple[str, str, str], ...]] = {
+    cat_key: tuple(
+        (profile_key, *PROFILE_INDEX[profile_key])
+        for profile_key in category.get("profiles", ())
+        if profile_key in PROFILE_INDEX
+    )
+    for cat_key, category in PROFILE_CATEGORIES.items()
+}
+
+# Categories joined with their profiles' menu metadata, for
+# get_categories_with_profiles(). Built-in categories never change, so the
+# join is done once here rather than on every menu refresh.
+_CATEGORIES_WITH_PROFILES: tuple[Mapping[str, Any], ...] = tuple(
+    MappingProxyType({
+        "key": cat_key,
+        "name": category["name"],
+        "description": category.get("description", ""),
+        "profiles": tuple(
+            MappingProxyType({"key": profile_key, "name": entry[0], "description": entry[1]})
+            for profile_key in category.get("profiles", ())
+            if (entry := PROFILE_INDEX.get(profile_key)) is not None
+        ),
+    })
+    for cat_key, category in PROFILE_CATEGORIES.items()
+)
+_REPOR_PROFILES_RO = MappingProxyType(
+    {key: MappingProxyType(profile) for key, profile in REPOR_PROFILES.items()}
+)
+
 
 class ProfileManager:
-    """Manager for preset project profiles."""
+    """
+    Manager for preset project profiles.
+
+    Built-in profiles and categories are shared, read-only module data and are
+    never copied per instance; custom profiles added with add_profile() are
+    the only per-instance, mutable layer.
+    """
+
+    __slots__ = (
+        "_builtin_profiles",
+        "_custom_profiles",
+        "_custom_meta",
+        "_profiles",
+        "_categories",
+        "_known_profile_names",
+        "_profile_names",
+        "_profile_descriptions",
+    )
 
     def __init__(self):
         """Initialize the profile manager with built-in profiles."""
-        self._profiles = PROFILES.copy()
-        self._categories = PROFILE_CATEGORIES.copy()
-        self._custom_profiles: dict[str, dict[str, Any]] = {}
+        # Built-ins are shared rather than copied; custom profiles live in their
+        # own dict, layered in front so they take precedence
+        self._builtin_profiles = _PROFILES_RO
+        self._custom_profiles: dict[str, Mapping[str, Any]] = {}
+        self._custom_meta: dict[str, dict[str, str]] = {}
+        self._profiles = ChainMap(self._custom_profiles, self._builtin_profiles)
+        self._categories = _PROFILE_CATEGORIES_RO
+        # Derived from the profile dicts on first use; reset by add_profile()
+        self._known_profile_names: frozenset[str] | None = None
+        self._profile_names: tuple[str, ...] | None = None
+        self._profile_descriptions: list[tuple[str, str, str]] | None = None
+
+    def _invalidate_caches(self) -> None:
+        """Drop values derived from the profile dicts after they change."""
+        self._known_profile_names = None
+        self._profile_names = None
+        self._profile_descriptions = None
+
+    @property
+    def known_profile_names(self) -> frozenset[str]:
+        """
+        Set of all available profile names, for fast membership checks.
+
+        Returns:
+            Frozenset of built-in and custom profile names
+        """
+        if self._known_profile_names is None:
+            self._known_profile_names = frozenset(self._profiles)
+        return self._known_profile_names
 
-    def get_profile(self, name: str) -> dict[str, Any]:
+    def get_profile(self, name: str) -> Mapping[str, Any]:
         """
         Get a profile by name.
 
@@ -534,25 +683,30 @@ class ProfileManager:
             name: Profile name (e.g., 'web_app', 'cli_tool')
 
         Returns:
-            Profile dictionary
+            Read-only profile mapping
 
         Raises:
             KeyError: If profile doesn't exist
         """
-        if name in self._custom_profiles:
-            return self._custom_profiles[name]
-        if name in self._profiles:
-            return self._profiles[name]
-        raise KeyError(f"Profile '{name}' not found. Available: {self.list_profiles()}")
-
-    def list_profiles(self) -> list[str]:
+        # Probe the layers directly: one dict.get each is cheaper than
+        # ChainMap's Python-level lookup. Profiles are never None.
+        profile = self._custom_profiles.get(name)
+        if profile is None:
+            profile = self._builtin_profiles.get(name)
+            if profile is None:
+                raise KeyError(f"Profile '{name}' not found. Available: {list(self.list_profiles())}")
+        return profile
+
+    def list_profiles(self) -> tuple[str, ...]:
         """
         List all available profile names.
 
         Returns:
-            List of profile names
+            Tuple of profile names (cached until a profile is added)
         """
-        return list(self._profiles.keys()) + list(self._custom_profiles.keys())
+        if self._profile_names is None:
+            self._profile_names = tuple(self._profiles)
+        return self._profile_names
 
     def get_profile_names_with_descriptions(self) -> list[tuple[str, str, str]]:
         """
@@ -561,12 +715,27 @@ class ProfileManager:
         Returns:
             List of tuples: (key, display_name, description)
         """
-        result = []
+        if self._profile_descriptions is None:
+            self._profile_descriptions = list(self.iter_profile_names_with_descriptions())
+        # Copy so callers can't alter the cached list
+        return self._profile_descriptions.copy()
+
+    def iter_profile_names_with_descriptions(self) -> Iterator[tuple[str, str, str]]:
+        """
+        Iterate over profile names with their display names and descriptions.
+
+        Unlike get_profile_names_with_descriptions(), no list is built, so
+        callers that stop early only pay for the entries they consume.
+
+        Yields:
+            Tuples of (key, display_name, description)
+        """
+        if not self._custom_profiles:
+            yield from PROFILE_CHOICES
+            return
+        # The ChainMap yields each key once, with custom profiles overriding
         for key, profile in self._profiles.items():
-            result.append((key, profile["name"], profile.get("description", "")))
-        for key, profile in self._custom_profiles.items():
-            result.append((key, profile["name"], profile.get("description", "")))
-        return result
+            yield (key, profile["name"], profile.get("description", ""))
 
     def apply_profile(self, base_config: dict[str, Any], profile_name: str) -> dict[str, Any]:
         """
@@ -582,26 +751,17 @@ class ProfileManager:
             Merged configuration dictionary
         """
         profile = self.get_profile(profile_name)
-        result = base_config.copy()
-
-        # Map profile fields to config fields
-        mappings = {
-            "languages": "languages",
-            "frameworks": "frameworks",
-            "platforms": "platforms",
-            "suggested_criteria": "success_criteria",
-            "suggested_must_use": "must_use",
-            "suggested_must_avoid": "must_avoid",
-        }
-
-        for profile_key, config_key in mappings.items():
-            if profile_key in profile:
-                if config_key not in result or not result[config_key]:
-                    result[config_key] = profile[profile_key]
+        result = dict(base_config)
+
+        # One probe into each dict per field; fill only missing or empty values
+        for profile_key, config_key in _PROFILE_FIELD_MAP:
+            value = profile.get(profile_key, _MISSING)
+            if value is not _MISSING and not result.get(config_key):
+                # Configs get their own list; profile sequences may be shared
+                result[config_key] = list(value) if isinstance(value, tuple) else value
 
         # Add profile metadata
-        result["_profile_name"] = profile_name
-        result["_profile_display_name"] = profile.get("name", profile_name)
+        result.update(self._custom_meta.get(profile_name) or _PROFILE_META[profile_name])
 
         return result
 
@@ -613,22 +773,24 @@ class ProfileManager:
             name: Profile name/key
             profile: Profile configuration dictionary
         """
-        if "name" not in profile:
-            profile["name"] = name.replace("_", " ").title()
-        self._custom_profiles[name] = profile
+        profile.setdefault("name", _default_display_name(name))
+        self._custom_profiles[name] = MappingProxyType(profile)
+        self._custom_meta[name] = _profile_meta(name, profile)
+        self._invalidate_caches()
 
-    def get_frameworks_for_profile(self, profile_name: str) -> list[str]:
+    def get_frameworks_for_profile(self, profile_name: str) -> tuple[str, ...]:
         """
-        Get the list of frameworks for a profile.
+        Get the frameworks for a profile.
 
         Args:
             profile_name: Name of the profile
 
         Returns:
-            List of framework names
+            Tuple of framework names
         """
         profile = self.get_profile(profile_name)
-        return profile.get("frameworks", [])
+        # No copy for built-ins, which already store tuples
+        return tuple(profile.get("frameworks", ()))
 
     # ===== Category Methods =====
 
@@ -641,7 +803,7 @@ class ProfileManager:
         """
         return list(self._categories.keys())
 
-    def get_category(self, category_key: str) -> dict[str, Any]:
+    def get_category(self, category_key: str) -> Mapping[str, Any]:
         """
         Get a category by key.
 
@@ -649,52 +811,36 @@ class ProfileManager:
             category_key: Category key (e.g., 'web', 'applications')
 
         Returns:
-            Category dictionary with name, description, and profiles list
+            Read-only category mapping with name, description, and profiles tuple
 
         Raises:
             KeyError: If category doesn't exist
         """
-        if category_key in self._categories:
-            return self._categories[category_key]
+        category = self._categories.get(category_key)
+        if category is not None:
+            return category
         raise KeyError(f"Category '{category_key}' not found. Available: {self.list_categories()}")
 
-    def get_categories_with_profiles(self) -> list[dict[str, Any]]:
+    def get_categories_with_profiles(self) -> tuple[Mapping[str, Any], ...]:
         """
         Get all categories with their profiles for menu display.
 
         Returns:
-            List of dicts with category info and nested profile info:
-            [
+            Tuple of read-only mappings with category info and nested profile info:
+            (
                 {
                     "key": "web",
                     "name": "Web & Internet",
                     "description": "...",
-                    "profiles": [
+                    "profiles": (
                         {"key": "website", "name": "Website", "description": "..."},
                         ...
-                    ]
+                    )
                 },
                 ...
-            ]
-        """
-        result = []
-        for cat_key, category in self._categories.items():
-            cat_info = {
-                "key": cat_key,
-                "name": category["name"],
-                "description": category.get("description", ""),
-                "profiles": [],
-            }
-            for profile_key in category.get("profiles", []):
-                if profile_key in self._profiles:
-                    profile = self._profiles[profile_key]
-                    cat_info["profiles"].append({
-                        "key": profile_key,
-                        "name": profile["name"],
-                        "description": profile.get("description", ""),
-                    })
-            result.append(cat_info)
-        return result
+            )
+        """
+        return _CATEGORIES_WITH_PROFILES
 
     def get_profiles_for_category(self, category_key: str) -> list[tuple[str, str, str]]:
         """
@@ -706,17 +852,11 @@ class ProfileManager:
         Returns:
             List of tuples: (profile_key, display_name, description)
         """
-        category = self.get_category(category_key)
-        result = []
-        for profile_key in category.get("profiles", []):
-            if profile_key in self._profiles:
-                profile = self._profiles[profile_key]
-                result.append((
-                    profile_key,
-                    profile["name"],
-                    profile.get("description", ""),
-                ))
-        return result
+        choices = _CATEGORY_PROFILE_CHOICES.get(category_key)
+        if choices is None:
+            # Raises the usual KeyError for an unknown category
+            self.get_category(category_key)
+        return list(choices)
 
     def get_category_for_profile(self, profile_key: str) -> str | None:
         """
@@ -728,20 +868,21 @@ class ProfileManager:
         Returns:
             Category key if found, None otherwise
         """
-        for cat_key, category in self._categories.items():
-            if profile_key in category.get("profiles", []):
-                return cat_key
-        return None
+        return _PROFILE_TO_CATEGORY.get(profile_key)
 
 
 class ReporProfileManager:
     """Manager for GECK Repor exploration profiles."""
 
+    __slots__ = ("_profiles", "_profile_names")
+
     def __init__(self):
         """Initialize with built-in exploration profiles."""
-        self._profiles = REPOR_PROFILES.copy()
+        self._profiles = _REPOR_PROFILES_RO
+        # The exploration profiles are fixed, so their names never change
+        self._profile_names = tuple(self._profiles)
 
-    def get_profile(self, name: str) -> dict[str, Any]:
+    def get_profile(self, name: str) -> Mapping[str, Any]:
         """
         Get an exploration profile by name.
 
@@ -749,23 +890,24 @@ class ReporProfileManager:
             name: Profile name (e.g., 'feature_discovery')
 
         Returns:
-            Profile dictionary
+            Read-only profile mapping
 
         Raises:
             KeyError: If profile doesn't exist
         """
-        if name in self._profiles:
-            return self._profiles[name]
-        raise KeyError(f"Repor profile '{name}' not found. Available: {self.list_profiles()}")
+        profile = self._profiles.get(name)
+        if profile is not None:
+            return profile
+        raise KeyError(f"Repor profile '{name}' not found. Available: {list(self.list_profiles())}")
 
-    def list_profiles(self) -> list[str]:
+    def list_profiles(self) -> tuple[str, ...]:
         """
         List all available exploration profile names.
 
         Returns:
-            List of profile names
+            Tuple of profile names
         """
-        return list(self._profiles.keys())
+        return self._profile_names
 
     def get_profile_choices(self) -> list[tuple[str, str, str]]:
         """
@@ -774,12 +916,9 @@ class ReporProfileManager:
         Returns:
             List of tuples: (key, display_name, description)
         """
-        result = [("none", "Custom / No Profile", "Enter your own exploration goals")]
-        for key, profile in self._profiles.items():
-            result.append((key, profile["name"], profile.get("description", "")))
-        return result
+        return list(REPOR_CHOICES)
 
-    def get_goals_for_profile(self, profile_name: str) -> list[str]:
+    def get_goals_for_profile(self, profile_name: str) -> tuple[str, ...]:
         """
         Get the exploration goals for a profile.
 
@@ -787,9 +926,36 @@ class ReporProfileManager:
             profile_name: Name of the profile
 
         Returns:
-            List of goal strings
+            Tuple of goal strings
         """
         if profile_name == "none" or not profile_name:
-            return []
+            return ()
         profile = self.get_profile(profile_name)
-        return profile.get("goals", [])
+        # No copy: the built-in profiles already store tuples
+        return tuple(profile.get("goals", ()))
+
+
+@lru_cache(maxsize=1)
+def get_profile_manager() -> ProfileManager:
+    """
+    Get the process-wide shared ProfileManager.
+
+    Used by the CLI and GUI, which each drive a single session. Custom profiles
+    added to the shared instance are visible to every caller, so library code
+    such as GECKGenerator constructs its own ProfileManager instead.
+
+    Returns:
+        Shared ProfileManager instance
+    """
+    return ProfileManager()
+
+
+@lru_cache(maxsize=1)
+def get_repor_profile_manager() -> ReporProfileManager:
+    """
+    Get the process-wide shared ReporProfileManager.
+
+    Returns:
+        Shared ReporProfileManager instance
+    """
+    return ReporProfileManager()
@@ -1,9 +1,20 @@
 """Template definitions and rendering for GECK Generator."""
 
+import os
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
-from jinja2 import Environment, BaseLoader, TemplateNotFound
+from jinja2 import (
+    BaseLoader,
+    BytecodeCache,
+    Environment,
+    FileSystemBytecodeCache,
+    Template,
+    TemplateNotFound,
+)
+
+from geck_generator._paths import user_cache_dir as _user_cache_dir
 
 
 # Main LLM_init.md template
@@ -349,11 +360,85 @@ class DictLoader(BaseLoader):
     def __init__(self, templates: dict[str, str]):
         self.templates = templates
 
-    def get_source(self, environment: Environment, template: str) -> tuple[str, str, callable]:
-        if template not in self.templates:
+    def get_source(self, environment: Environment, template: str) -> tuple[str, str, None]:
+        source = self.templates.get(template)
+        if source is None:
             raise TemplateNotFound(template)
-        source = self.templates[template]
-        return source, template, lambda: True
+        # No uptodate callable: the dictionary's templates never change
+        return source, template, None
+
+
+def _get_bytecode_cache() -> BytecodeCache | None:
+    """
+    Get an on-disk bytecode cache so compiled templates survive between runs.
+
+    Returns:
+        FileSystemBytecodeCache in the user cache directory, or None if that
+        directory can't be created or written to
+    """
+    directory = _user_cache_dir() / "jinja_bc"
+    try:
+        directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+    except OSError:
+        return None
+    if not os.access(directory, os.W_OK):
+        return None
+    return FileSystemBytecodeCache(str(directory), pattern="%s.cache")
+
+
+# Process-wide environment for the built-in templates, created on first use so
+# compiled templates are shared by every TemplateEngine instance.
+_ENVIRONMENT: Environment | None = None
+
+
+def _get_environment() -> Environment:
+    """Return the shared Jinja2 environment, creating it if necessary."""
+    global _ENVIRONMENT
+    if _ENVIRONMENT is None:
+        _ENVIRONMENT = Environment(
+            loader=DictLoader(TemplateEngine.TEMPLATES),
+            trim_blocks=True,
+            lstrip_blocks=True,
+            auto_reload=False,
+            cache_size=400,
+            bytecode_cache=_get_bytecode_cache(),
+        )
+    return _ENVIRONMENT
+
+
+# Compiled built-in templates by name, filled the first time each is used so
+# later renders skip the environment's loader and cache lookups.
+_COMPILED_TEMPLATES: dict[str, Template] = {}
+
+
+def _get_builtin_template(name: str) -> Template:
+    """Return a compiled built-in template, compiling it on first use."""
+    template = _COMPILED_TEMPLATES.get(name)
+    if template is None:
+        template = _COMPILED_TEMPLATES[name] = _get_environment().get_template(name)
+    return template
+
+
+def _with_defaults(variables: dict[str, Any]) -> dict[str, Any]:
+    """
+    Add default template variables the caller didn't supply.
+
+    Args:
+        variables: Variables passed to a render call
+
+    Returns:
+        The same dict when nothing is missing, otherwise a merged copy
+    """
+    # Only look up the date when the caller didn't pass one
+    if "created_date" in variables:
+        return variables
+    return {"created_date": datetime.now().strftime("%Y-%m-%d"), **variables}
+
+
+@lru_cache(maxsize=64)
+def _compile_string(source: str) -> Template:
+    """Compile a template string in the shared environment, reusing earlier results."""
+    return _get_environment().from_string(source)
 
 
 class TemplateEngine:
@@ -371,11 +456,7 @@ class TemplateEngine:
 
     def __init__(self):
         """Initialize the template engine with built-in templates."""
-        self.env = Environment(
-            loader=DictLoader(self.TEMPLATES),
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
+        self.env = _get_environment()
         self._custom_templates: dict[str, str] = {}
 
     def render(self, template_name: str, variables: dict[str, Any]) -> str:
@@ -389,19 +470,16 @@ class TemplateEngine:
         Returns:
             Rendered template string
         """
-        # Add default variables
-        defaults = {
-            "created_date": datetime.now().strftime("%Y-%m-%d"),
-        }
-        merged_vars = {**defaults, **variables}
-
         # Try custom templates first, then built-in
         if template_name in self._custom_templates:
-            template = self.env.from_string(self._custom_templates[template_name])
+            template = _compile_string(self._custom_templates[template_name])
         else:
-            template = self.env.get_template(template_name)
+            static = _STATIC_TEMPLATES.get(template_name)
+            if static is not None:
+                return static
+            template = _get_builtin_template(template_name)
 
-        return template.render(**merged_vars)
+        return template.render(**_with_defaults(variables))
 
     def render_string(self, template_string: str, variables: dict[str, Any]) -> str:
         """
@@ -414,12 +492,9 @@ class TemplateEngine:
         Returns:
             Rendered template string
         """
-        defaults = {
-            "created_date": datetime.now().strftime("%Y-%m-%d"),
-        }
-        merged_vars = {**defaults, **variables}
+        merged_vars = _with_defaults(variables)
 
-        template = self.env.from_string(template_string)
+        template = _compile_string(template_string)
         return template.render(**merged_vars)
 
     def list_templates(self) -> list[str]:
@@ -433,6 +508,36 @@ class TemplateEngine:
         custom = list(self._custom_templates.keys())
         return built_in + custom
 
+    def get_template_source(self, name: str) -> str:
+        """
+        Get the source a template name currently renders from.
+
+        Args:
+            name: Template name
+
+        Returns:
+            The custom template's source if one was added, else the built-in's
+
+        Raises:
+            KeyError: If no template has that name
+        """
+        source = self._custom_templates.get(name)
+        return source if source is not None else self.TEMPLATES[name]
+
+    def precompile(self) -> list[str]:
+        """
+        Compile all built-in templates into the shared environment.
+
+        This also writes them to the on-disk bytecode cache (when available),
+        so later processes can skip parsing entirely.
+
+        Returns:
+            List of compiled template names
+        """
+        for name in self.TEMPLATES:
+            _get_builtin_template(name)
+        return list(self.TEMPLATES)
+
     def add_template(self, name: str, template_string: str) -> None:
         """
         Add a custom template.
@@ -454,3 +559,13 @@ class TemplateEngine:
         with open(filepath, "r", encoding="utf-8") as f:
             template_string = f.read()
         self.add_template(name, template_string)
+
+
+# Built-in templates without any Jinja2 syntax render to their own source,
+# minus the single trailing newline Jinja2 drops, so render() returns them
+# without going through Jinja2 at all.
+_STATIC_TEMPLATES: dict[str, str] = {
+    name: source.removesuffix("\n")
+    for name, source in TemplateEngine.TEMPLATES.items()
+    if "{{" not in source and "{%" not in source and "{#" not in source
+}
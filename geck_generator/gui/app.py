@@ -7,7 +7,7 @@ from typing import Any
 import sys
 
 from geck_generator.core.generator import GECKGenerator
-from geck_generator.core.profiles import ProfileManager, ReporProfileManager
+from geck_generator.core.profiles import get_profile_manager, get_repor_profile_manager
 from geck_generator.utils.git_utils import (
     is_git_repo,
     suggest_repo_url,
@@ -46,8 +46,8 @@ class GECKGeneratorGUI:
         self.root.minsize(700, 600)
 
         self.generator = GECKGenerator()
-        self.profiles = ProfileManager()
-        self.repor_profiles = ReporProfileManager()
+        self.profiles = get_profile_manager()
+        self.repor_profiles = get_repor_profile_manager()
 
         # Variables for Bootstrapper
         self.project_name_var = tk.StringVar()
@@ -832,7 +832,7 @@ class GECKGeneratorGUI:
 
         # Update suggested criteria
         if profile.get("suggested_criteria"):
-            self.criteria_list = profile["suggested_criteria"].copy()
+            self.criteria_list = list(profile["suggested_criteria"])
             self.update_criteria_listbox()
 
     def add_criterion(self):
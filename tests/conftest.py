@@ -5,11 +5,30 @@ import tempfile
 import shutil
 from pathlib import Path
 
-from geck_generator.core.generator import GECKGenerator
+from geck_generator.core import generator as generator_module
+from geck_generator.core import templates as templates_module
+from geck_generator.core.generator import GECKGenerator, _detect_static_environment
 from geck_generator.core.profiles import ProfileManager, ReporProfileManager
 from geck_generator.core.templates import TemplateEngine
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """Keep the env.json and Jinja2 bytecode caches out of the real user cache dir."""
+    cache_dir = tmp_path / "user_cache"
+    # Environment variables cover CLI subprocesses; the patches cover this process
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_dir))
+    monkeypatch.setenv("LOCALAPPDATA", str(cache_dir))
+    monkeypatch.setattr(generator_module, "user_cache_dir", lambda: cache_dir / "geck_generator")
+    monkeypatch.setattr(templates_module, "_user_cache_dir", lambda: cache_dir / "geck_generator")
+    # Rebuild the shared Jinja2 environment so its bytecode cache uses cache_dir
+    monkeypatch.setattr(templates_module, "_ENVIRONMENT", None)
+    monkeypatch.setattr(templates_module, "_COMPILED_TEMPLATES", {})
+    _detect_static_environment.cache_clear()
+    yield cache_dir
+    _detect_static_environment.cache_clear()
+
+
 @pytest.fixture
 def generator():
     """Provide a GECKGenerator instance."""
@@ -0,0 +1,32 @@
+"""Tests for geck_generator.core.config module."""
+
+from geck_generator.core.config import GeckConfig
+
+
+class TestGeckConfig:
+    """Tests for the GeckConfig dataclass."""
+
+    def test_defaults_match_config_template(self, generator):
+        """GeckConfig defaults should match get_config_template."""
+        assert GeckConfig().to_dict() == generator.get_config_template()
+
+    def test_uses_slots(self):
+        """GeckConfig should not carry a per-instance __dict__."""
+        assert not hasattr(GeckConfig(), "__dict__")
+
+    def test_from_dict_ignores_unknown_keys(self, sample_config):
+        """from_dict should keep known fields and drop extra keys."""
+        config = GeckConfig.from_dict({**sample_config, "_profile_name": "cli_tool"})
+        assert config.project_name == sample_config["project_name"]
+        assert config.platforms == sample_config["platforms"]
+
+    def test_generate_accepts_geck_config(self, generator, sample_config):
+        """generate should render a GeckConfig the same as the equivalent dict."""
+        config = GeckConfig.from_dict(sample_config)
+        assert generator.generate(config) == generator.generate(config.to_dict())
+
+    def test_validate_config_accepts_geck_config(self, generator):
+        """validate_config should report missing fields on a GeckConfig."""
+        errors = generator.validate_config(GeckConfig())
+        assert "Project name is required" in errors
+        assert "Project goal is required" in errors
@@ -3,7 +3,13 @@
 import pytest
 from pathlib import Path
 
-from geck_generator.core.generator import GECKGenerator, _detect_environment
+from geck_generator.core import generator as generator_module
+from geck_generator.core.generator import (
+    GECKGenerator,
+    _detect_environment,
+    _detect_static_environment,
+    clear_generate_cache,
+)
 
 
 class TestDetectEnvironment:
@@ -33,6 +39,53 @@ class TestDetectEnvironment:
         result = _detect_environment()
         assert "Python" in result["runtime_versions"]
 
+    def test_static_environment_is_cached(self):
+        """Repeated calls should reuse the cached static environment probe."""
+        _detect_static_environment.cache_clear()
+        first = _detect_environment()
+        second = _detect_environment()
+
+        assert _detect_static_environment.cache_info().hits >= 1
+        assert first["runtime_versions"] == second["runtime_versions"]
+        # Callers get their own copy of the cached data
+        assert first["runtime_versions"] is not second["runtime_versions"]
+
+    def test_missing_tools_are_not_spawned(self, temp_dir, monkeypatch):
+        """Tools not found on PATH should be skipped without running them."""
+        import shutil
+        import subprocess
+
+        def fail_run(*args, **kwargs):
+            raise AssertionError("subprocess.run should not be called")
+
+        monkeypatch.setattr(generator_module, "_env_cache_path", lambda: temp_dir / "env.json")
+        monkeypatch.setattr(shutil, "which", lambda cmd: None)
+        monkeypatch.setattr(subprocess, "run", fail_run)
+        _detect_static_environment.cache_clear()
+        try:
+            result = _detect_environment()
+        finally:
+            _detect_static_environment.cache_clear()
+
+        assert list(result["runtime_versions"]) == ["Python"]
+
+    def test_static_environment_reused_from_disk(self, temp_dir, monkeypatch):
+        """A fresh on-disk environment cache should be used instead of probing."""
+        monkeypatch.setattr(generator_module, "_env_cache_path", lambda: temp_dir / "env.json")
+        _detect_static_environment.cache_clear()
+        try:
+            first = _detect_static_environment()
+            assert (temp_dir / "env.json").exists()
+
+            def fail_probe():
+                raise AssertionError("environment should come from the disk cache")
+
+            monkeypatch.setattr(generator_module, "_probe_static_environment", fail_probe)
+            _detect_static_environment.cache_clear()
+            assert _detect_static_environment() == first
+        finally:
+            _detect_static_environment.cache_clear()
+
     def test_timestamp_is_formatted(self):
         """timestamp should be a formatted string."""
         result = _detect_environment()
@@ -52,6 +105,38 @@ class TestGECKGenerator:
         """GECKGenerator should create a profile manager."""
         assert generator.profiles is not None
 
+    def test_init_is_lazy(self):
+        """GECKGenerator should not build its engine until it is used."""
+        gen = GECKGenerator()
+        assert "template_engine" not in vars(gen)
+        assert "profiles" not in vars(gen)
+
+        gen.validate_config({"project_name": "Test", "goal": "Test goal"})
+        assert "template_engine" not in vars(gen)
+
+    def test_generators_share_environment_only(self, generator):
+        """GECKGenerator instances should share the Jinja2 environment, not engines or profiles."""
+        other = GECKGenerator()
+        assert other.template_engine is not generator.template_engine
+        assert other.template_engine.env is generator.template_engine.env
+        assert other.profiles is not generator.profiles
+
+    def test_custom_profiles_stay_per_generator(self, generator):
+        """A custom profile added to one generator should not affect another."""
+        generator.profiles.add_profile("mine", {"description": "Mine"})
+        config = {"project_name": "Test", "goal": "Test goal", "profile": "mine"}
+
+        assert generator.validate_config(config) == []
+        other = GECKGenerator()
+        assert "mine" not in other.profiles.list_profiles()
+        assert other.validate_config(config) != []
+
+    def test_custom_templates_stay_per_generator(self, generator):
+        """A custom template added to one generator should not affect another."""
+        generator.template_engine.add_template("repor", "Custom repor")
+        other = GECKGenerator()
+        assert other.template_engine.render("repor", {"repositories": []}) != "Custom repor"
+
     def test_generate_returns_string(self, generator, sample_config):
         """generate should return a string."""
         result = generator.generate(sample_config)
@@ -93,6 +178,67 @@ class TestGECKGenerator:
         # Should use default project name
         assert "Untitled Project" in result
 
+    def test_generate_does_not_mutate_config(self, generator, minimal_config):
+        """generate should leave the caller's config untouched."""
+        original = minimal_config.copy()
+        generator.generate(minimal_config)
+        assert minimal_config == original
+
+    def test_prepare_config_is_idempotent(self, generator, sample_config_with_profile):
+        """Preparing an already prepared config should return it unchanged."""
+        prepared = generator._prepare_config(sample_config_with_profile)
+        assert generator._prepare_config(prepared) is prepared
+        assert prepared["_profile_name"] == "cli_tool"
+
+    def test_prepare_config_is_read_only(self, generator, sample_config):
+        """_prepare_config should return a mapping that can't be modified."""
+        prepared = generator._prepare_config(sample_config)
+        with pytest.raises(TypeError):
+            prepared["goal"] = "changed"
+
+    def test_generate_uses_overridden_llm_init(self, generator, sample_config):
+        """Overriding llm_init after a cached generate should change the output."""
+        generator.generate(sample_config)
+        generator.template_engine.add_template("llm_init", "Custom: {{ project_name }}")
+        assert generator.generate(sample_config) == "Custom: Test Project"
+
+    def test_prepare_config_adds_no_marker_key(self, generator, sample_config_with_profile):
+        """A caller-supplied '_prepared' key should not skip profile application."""
+        prepared = generator._prepare_config(sample_config_with_profile)
+        assert "_prepared" not in prepared
+
+        config = dict(sample_config_with_profile, _prepared=True)
+        assert generator._prepare_config(config)["_profile_name"] == "cli_tool"
+
+    def test_generate_caches_identical_configs(self, generator, sample_config):
+        """Repeated generate calls with the same config should hit the cache."""
+        clear_generate_cache()
+        first = generator.generate(sample_config)
+        assert len(generator_module._GENERATE_CACHE) == 1
+
+        second = generator.generate(dict(sample_config))
+        assert second == first
+        assert len(generator_module._GENERATE_CACHE) == 1
+
+        clear_generate_cache()
+        assert len(generator_module._GENERATE_CACHE) == 0
+
+    def test_generate_cache_distinguishes_configs(self, generator, sample_config):
+        """Different configs should not share cached output."""
+        changed = {**sample_config, "goal": "A completely different goal"}
+        assert generator.generate(sample_config) != generator.generate(changed)
+
+    def test_generate_cache_distinguishes_equal_scalars(self, generator, minimal_config):
+        """Values that compare equal but render differently should not share output."""
+        assert "True" in generator.generate({**minimal_config, "context": True})
+        assert "True" not in generator.generate({**minimal_config, "context": 1})
+        assert "1.0" in generator.generate({**minimal_config, "context": 1.0})
+
+    def test_generate_with_unhashable_value(self, generator, minimal_config):
+        """Configs with values that can't be frozen should still render."""
+        config = {**minimal_config, "extra": bytearray(b"data")}
+        assert minimal_config["project_name"] in generator.generate(config)
+
     def test_validate_config_returns_empty_for_valid(self, generator, sample_config):
         """validate_config should return empty list for valid config."""
         errors = generator.validate_config(sample_config)
@@ -132,6 +278,16 @@ class TestGECKGenerator:
         errors = generator.validate_config(config)
         assert len(errors) > 0
 
+    def test_validate_config_catches_invalid_platforms_type(self, generator):
+        """validate_config should catch non-list platforms."""
+        config = {
+            "project_name": "Test",
+            "goal": "Test goal",
+            "platforms": "Linux",
+        }
+        errors = generator.validate_config(config)
+        assert errors == ["Platforms must be a list"]
+
     def test_get_config_template(self, generator):
         """get_config_template should return a template dict."""
         template = generator.get_config_template()
@@ -140,6 +296,16 @@ class TestGECKGenerator:
         assert "goal" in template
         assert "success_criteria" in template
 
+    def test_get_config_template_returns_independent_copies(self, generator):
+        """Mutating one config template should not affect the next."""
+        first = generator.get_config_template()
+        first["success_criteria"].append("Done")
+        first["project_name"] = "Changed"
+
+        second = generator.get_config_template()
+        assert second["success_criteria"] == []
+        assert second["project_name"] == ""
+
 
 class TestGECKGeneratorFileOperations:
     """Tests for GECKGenerator file operations."""
@@ -162,6 +328,18 @@ class TestGECKGeneratorFileOperations:
 
         assert actual == expected
 
+    def test_generate_to_file_uses_platform_line_endings(
+        self, generator, sample_config, temp_dir, monkeypatch
+    ):
+        """Generated files should get platform line endings, as text-mode writes did."""
+        monkeypatch.setattr(generator_module.os, "linesep", "\r\n")
+        output_path = temp_dir / "LLM_init.md"
+        generator.generate_to_file(sample_config, output_path)
+
+        data = output_path.read_bytes()
+        assert b"\r\n" in data
+        assert data.replace(b"\r\n", b"").count(b"\n") == 0
+
     def test_generate_to_file_creates_parent_dirs(self, generator, sample_config, temp_dir):
         """generate_to_file should create parent directories."""
         output_path = temp_dir / "subdir" / "nested" / "LLM_init.md"
@@ -169,6 +347,45 @@ class TestGECKGeneratorFileOperations:
 
         assert output_path.exists()
 
+    def test_generate_to_file_recreates_removed_dir(self, generator, sample_config, temp_dir):
+        """generate_to_file should recreate a directory removed between calls."""
+        output_path = temp_dir / "removed" / "LLM_init.md"
+        generator.generate_to_file(sample_config, output_path)
+
+        output_path.unlink()
+        output_path.parent.rmdir()
+        generator.generate_to_file(sample_config, output_path)
+
+        assert output_path.exists()
+
+    def test_generate_from_template_file_writes_output(self, generator, temp_dir):
+        """generate_from_template_file should write and return the same content."""
+        template_path = temp_dir / "custom.md.j2"
+        template_path.write_text(
+            "# {{ project_name }}\n{% for i in items %}- {{ i }}\n{% endfor %}",
+            encoding="utf-8",
+        )
+        output_path = temp_dir / "out" / "custom.md"
+
+        content = generator.generate_from_template_file(
+            template_path, {"project_name": "Custom", "items": ["a", "b"]}, output_path
+        )
+
+        assert content == "# Custom\n- a\n- b\n"
+        assert output_path.read_text(encoding="utf-8") == content
+
+    def test_generate_from_template_file_error_keeps_existing_output(self, generator, temp_dir):
+        """A template that fails while rendering should leave the output file unchanged."""
+        template_path = temp_dir / "broken.md.j2"
+        template_path.write_text("{% for i in items %}{{ i }}\n{% endfor %}{{ 1 // 0 }}", encoding="utf-8")
+        output_path = temp_dir / "custom.md"
+        output_path.write_text("original", encoding="utf-8")
+
+        with pytest.raises(ZeroDivisionError):
+            generator.generate_from_template_file(template_path, {"items": range(1000)}, output_path)
+
+        assert output_path.read_text(encoding="utf-8") == "original"
+
     def test_init_geck_folder_creates_structure(self, generator, sample_config, temp_dir):
         """init_geck_folder should create complete GECK structure."""
         geck_path = generator.init_geck_folder(temp_dir, sample_config)
@@ -185,6 +402,33 @@ class TestGECKGeneratorFileOperations:
         assert (geck_path / "tasks.md").exists()
         assert (geck_path / "log.md").exists()
 
+    def test_init_geck_folder_skips_unchanged_files(self, generator, sample_config, temp_dir, monkeypatch):
+        """Re-running init_geck_folder should not rewrite files with identical content."""
+        geck_path = generator.init_geck_folder(temp_dir, sample_config)
+        assert (geck_path / ".geck-manifest.json").exists()
+
+        written = []
+        real_write_bytes = generator_module._write_bytes
+        monkeypatch.setattr(
+            generator_module,
+            "_write_bytes",
+            lambda path, data: written.append(path.name) or real_write_bytes(path, data),
+        )
+        generator.init_geck_folder(temp_dir, sample_config)
+
+        # GECK_Inst.md is static, so it must not be written again
+        assert "GECK_Inst.md" not in written
+
+    def test_init_geck_folder_rewrites_edited_files(self, generator, sample_config, temp_dir):
+        """Files edited since the last run should be regenerated."""
+        geck_path = generator.init_geck_folder(temp_dir, sample_config)
+        inst = geck_path / "GECK_Inst.md"
+        original = inst.read_text(encoding="utf-8")
+        inst.write_text("edited", encoding="utf-8")
+
+        generator.init_geck_folder(temp_dir, sample_config)
+        assert inst.read_text(encoding="utf-8") == original
+
     def test_init_geck_folder_llm_init_in_geck_folder(self, generator, sample_config, temp_dir):
         """init_geck_folder should place LLM_init.md inside GECK folder."""
         geck_path = generator.init_geck_folder(temp_dir, sample_config)
@@ -282,6 +526,46 @@ class TestGECKGeneratorReporFeature:
         )
         assert output_path.exists()
 
+    def test_generate_repor_instructions_reads_origin_url(self, generator, temp_dir):
+        """generate_repor_instructions should pick up the origin remote URL."""
+        git_dir = temp_dir / ".git"
+        git_dir.mkdir()
+        (git_dir / "config").write_text(
+            '[remote "upstream"]\n'
+            "\turl = https://github.com/example/upstream\n"
+            '[remote "origin"]\n'
+            "\turl = https://github.com/example/origin\n"
+            "\tfetch = +refs/heads/*:refs/remotes/origin/*\n"
+            "\tfetch = +refs/tags/*:refs/tags/*\n",
+            encoding="utf-8",
+        )
+        result = generator.generate_repor_instructions(
+            working_directory=temp_dir,
+            repositories=["https://github.com/example/repo"],
+            exploration_goals=[],
+        )
+        assert "https://github.com/example/origin" in result
+        assert "https://github.com/example/upstream" not in result
+
+    def test_generate_repor_instructions_handles_valueless_keys(self, generator, temp_dir):
+        """A git config with valueless keys should still yield the origin URL."""
+        git_dir = temp_dir / ".git"
+        git_dir.mkdir()
+        (git_dir / "config").write_text(
+            "[core]\n"
+            "\tbare\n"
+            "\trepositoryformatversion = 0\n"
+            '[remote "origin"]\n'
+            "\turl = https://github.com/example/origin\n",
+            encoding="utf-8",
+        )
+        result = generator.generate_repor_instructions(
+            working_directory=temp_dir,
+            repositories=["https://github.com/example/repo"],
+            exploration_goals=[],
+        )
+        assert "https://github.com/example/origin" in result
+
     def test_generate_repor_instructions_derives_project_name(self, generator, temp_dir):
         """generate_repor_instructions should derive project name from directory."""
         result = generator.generate_repor_instructions(
@@ -55,6 +55,17 @@ class TestCLICommands:
         assert "llm_init" in result.stdout
         assert "geck_inst" in result.stdout
 
+    def test_precompile_templates(self):
+        """--precompile-templates should compile the built-in templates."""
+        result = subprocess.run(
+            [sys.executable, "-m", "geck_generator", "--precompile-templates"],
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+        assert result.returncode == 0
+        assert "llm_init" in result.stdout
+
     def test_shortcut_info(self):
         """--shortcut-info should print shortcut information."""
         result = subprocess.run(
@@ -105,6 +116,19 @@ class TestCLICommands:
         content = output_file.read_text(encoding="utf-8")
         assert "TestCLI" in content
 
+    def test_profile_generation_prompts_from_stdin(self):
+        """--profile should read a missing name and goal from stdin."""
+        result = subprocess.run(
+            [sys.executable, "-m", "geck_generator", "--profile", "cli_tool"],
+            input="PromptedCLI\nA prompted goal for integration testing\n",
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+        assert result.returncode == 0
+        assert "# Project: PromptedCLI" in result.stdout
+        assert "A prompted goal for integration testing" in result.stdout
+
     def test_invalid_profile_fails(self):
         """--profile with invalid name should fail."""
         result = subprocess.run(
@@ -280,6 +304,46 @@ class TestModuleImports:
         assert isinstance(__version__, str)
         assert len(__version__) > 0
 
+    def test_package_import_is_lazy(self):
+        """Importing the package should not load Jinja2 until a class is used."""
+        result = subprocess.run(
+            [
+                sys.executable, "-c",
+                "import sys, geck_generator; print('jinja2' in sys.modules); "
+                "geck_generator.TemplateEngine; print('jinja2' in sys.modules)",
+            ],
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+        assert result.returncode == 0
+        assert result.stdout.split() == ["False", "True"]
+
+    def test_profiles_load_on_first_use(self):
+        """Generating without a profile should not load the profile definitions."""
+        result = subprocess.run(
+            [
+                sys.executable, "-c",
+                "import sys; from geck_generator.core.generator import GECKGenerator; "
+                "GECKGenerator().generate({'project_name': 'P', 'goal': 'G'}); "
+                "print('geck_generator.core.profiles' in sys.modules)",
+            ],
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+        assert result.returncode == 0
+        assert result.stdout.split() == ["False"]
+
+    def test_lazy_exports_resolve(self):
+        """Lazy re-exports should resolve to the core classes."""
+        import geck_generator
+        from geck_generator.core.generator import GECKGenerator
+
+        assert geck_generator.GECKGenerator is GECKGenerator
+        with pytest.raises(AttributeError):
+            geck_generator.does_not_exist
+
 
 class TestEndToEndWorkflow:
     """End-to-end workflow tests."""
@@ -1,5 +1,7 @@
 """Tests for geck_generator.core.profiles module."""
 
+from collections.abc import Mapping
+
 import pytest
 
 from geck_generator.core.profiles import (
@@ -7,6 +9,8 @@ from geck_generator.core.profiles import (
     ReporProfileManager,
     PROFILES,
     REPOR_PROFILES,
+    get_profile_manager,
+    get_repor_profile_manager,
 )
 
 
@@ -21,9 +25,11 @@ class TestProfileManager:
         assert "cli_tool" in profiles
 
     def test_get_profile_returns_dict(self, profile_manager):
-        """get_profile should return a profile dictionary."""
+        """get_profile should return a read-only profile mapping."""
         profile = profile_manager.get_profile("web_app")
-        assert isinstance(profile, dict)
+        assert isinstance(profile, Mapping)
+        with pytest.raises(TypeError):
+            profile["name"] = "Changed"
         assert "name" in profile
         assert "description" in profile
 
@@ -32,10 +38,10 @@ class TestProfileManager:
         with pytest.raises(KeyError):
             profile_manager.get_profile("nonexistent_profile")
 
-    def test_list_profiles_returns_list(self, profile_manager):
-        """list_profiles should return a list of profile names."""
+    def test_list_profiles_returns_tuple(self, profile_manager):
+        """list_profiles should return a tuple of profile names."""
         profiles = profile_manager.list_profiles()
-        assert isinstance(profiles, list)
+        assert isinstance(profiles, tuple)
         assert all(isinstance(p, str) for p in profiles)
 
     def test_get_profile_names_with_descriptions(self, profile_manager):
@@ -49,6 +55,16 @@ class TestProfileManager:
             assert isinstance(key, str)
             assert isinstance(name, str)
 
+    def test_iter_profile_names_matches_list(self, profile_manager):
+        """iter_profile_names_with_descriptions should yield the listed entries lazily."""
+        profile_manager.add_profile("custom_iter", {"description": "Iterated"})
+        entries = profile_manager.iter_profile_names_with_descriptions()
+
+        assert next(entries) == profile_manager.get_profile_names_with_descriptions()[0]
+        assert list(profile_manager.iter_profile_names_with_descriptions()) == (
+            profile_manager.get_profile_names_with_descriptions()
+        )
+
     def test_apply_profile_merges_config(self, profile_manager):
         """apply_profile should merge profile values into config."""
         base_config = {"project_name": "Test"}
@@ -72,6 +88,14 @@ class TestProfileManager:
         # Should keep the existing value
         assert result["languages"] == "Rust"
 
+    def test_apply_profile_returns_list_fields(self, profile_manager):
+        """apply_profile should give each config its own platform list."""
+        result = profile_manager.apply_profile({}, "cli_tool")
+        assert result["platforms"] == ["Linux", "Windows", "macOS"]
+
+        result["platforms"].append("Docker")
+        assert "Docker" not in profile_manager.get_profile("library")["platforms"]
+
     def test_add_profile(self, profile_manager):
         """add_profile should add a custom profile."""
         custom_profile = {
@@ -85,12 +109,87 @@ class TestProfileManager:
         retrieved = profile_manager.get_profile("custom_test")
         assert retrieved["languages"] == "Go"
 
+    def test_known_profile_names_includes_custom(self, profile_manager):
+        """known_profile_names should reflect custom profiles once added."""
+        assert "web_app" in profile_manager.known_profile_names
+        assert "custom_known" not in profile_manager.known_profile_names
+
+        profile_manager.add_profile("custom_known", {"description": "Custom"})
+        assert "custom_known" in profile_manager.known_profile_names
+
+    def test_list_profiles_includes_custom_after_caching(self, profile_manager):
+        """list_profiles should reflect custom profiles added after a call."""
+        names = profile_manager.list_profiles()
+        assert profile_manager.list_profiles() is names
+
+        profile_manager.add_profile("custom_listed", {"description": "Custom"})
+        assert profile_manager.list_profiles()[-1] == "custom_listed"
+
+    def test_custom_profile_overrides_builtin(self, profile_manager):
+        """A custom profile with a built-in name should take precedence."""
+        profile_manager.add_profile("web_app", {"name": "My Web App"})
+
+        assert profile_manager.get_profile("web_app")["name"] == "My Web App"
+        assert profile_manager.list_profiles().count("web_app") == 1
+        descriptions = profile_manager.get_profile_names_with_descriptions()
+        assert [entry[1] for entry in descriptions if entry[0] == "web_app"] == ["My Web App"]
+        # The shared built-in definition is left untouched
+        assert ProfileManager().get_profile("web_app")["name"] != "My Web App"
+
+    def test_descriptions_include_custom_after_caching(self, profile_manager):
+        """get_profile_names_with_descriptions should pick up new custom profiles."""
+        before = profile_manager.get_profile_names_with_descriptions()
+        profile_manager.add_profile("custom_described", {"description": "Described"})
+        after = profile_manager.get_profile_names_with_descriptions()
+
+        assert len(after) == len(before) + 1
+        assert after[-1] == ("custom_described", "Custom Described", "Described")
+
+    def test_managers_have_no_instance_dict(self, profile_manager, repor_profile_manager):
+        """Profile managers should use __slots__ instead of a per-instance __dict__."""
+        assert not hasattr(profile_manager, "__dict__")
+        assert not hasattr(repor_profile_manager, "__dict__")
+
     def test_get_frameworks_for_profile(self, profile_manager):
-        """get_frameworks_for_profile should return framework list."""
+        """get_frameworks_for_profile should return a framework tuple."""
         frameworks = profile_manager.get_frameworks_for_profile("web_app")
-        assert isinstance(frameworks, list)
+        assert isinstance(frameworks, tuple)
         assert len(frameworks) > 0
 
+    def test_get_category_for_profile(self, profile_manager):
+        """get_category_for_profile should map profile keys to their category."""
+        assert profile_manager.get_category_for_profile("web_app") == "web"
+        assert profile_manager.get_category_for_profile("blockchain") == "systems"
+        assert profile_manager.get_category_for_profile("nonexistent") is None
+
+    def test_get_category_is_read_only(self, profile_manager):
+        """get_category should return a read-only category mapping."""
+        category = profile_manager.get_category("web")
+        assert isinstance(category, Mapping)
+        assert "web_app" in category["profiles"]
+        with pytest.raises(TypeError):
+            category["name"] = "Changed"
+
+    def test_get_profiles_for_category(self, profile_manager):
+        """get_profiles_for_category should list a category's profiles in order."""
+        profiles = profile_manager.get_profiles_for_category("creative")
+        assert [key for key, _, _ in profiles] == ["game", "shader_creative"]
+
+        profiles.clear()
+        assert profile_manager.get_profiles_for_category("creative")
+        with pytest.raises(KeyError):
+            profile_manager.get_profiles_for_category("nonexistent")
+
+    def test_get_categories_with_profiles(self, profile_manager):
+        """get_categories_with_profiles should join categories with profile metadata."""
+        categories = profile_manager.get_categories_with_profiles()
+        web = next(cat for cat in categories if cat["key"] == "web")
+
+        assert web["name"] == "Web & Internet"
+        assert {"key": "web_app", "name": "Web App",
+                "description": PROFILES["web_app"]["description"]} in web["profiles"]
+        assert profile_manager.get_categories_with_profiles() is categories
+
     def test_all_builtin_profiles_have_required_fields(self, profile_manager):
         """All built-in profiles should have required fields."""
         required_fields = ["name", "description"]
@@ -112,9 +211,9 @@ class TestReporProfileManager:
         assert "security_audit" in profiles
 
     def test_get_profile_returns_dict(self, repor_profile_manager):
-        """get_profile should return a profile dictionary."""
+        """get_profile should return a read-only profile mapping."""
         profile = repor_profile_manager.get_profile("feature_discovery")
-        assert isinstance(profile, dict)
+        assert isinstance(profile, Mapping)
         assert "name" in profile
         assert "goals" in profile
 
@@ -134,16 +233,16 @@ class TestReporProfileManager:
         assert first[0] == "none"
 
     def test_get_goals_for_profile(self, repor_profile_manager):
-        """get_goals_for_profile should return goals list."""
+        """get_goals_for_profile should return a goals tuple."""
         goals = repor_profile_manager.get_goals_for_profile("security_audit")
-        assert isinstance(goals, list)
+        assert isinstance(goals, tuple)
         assert len(goals) > 0
         assert all(isinstance(g, str) for g in goals)
 
     def test_get_goals_for_none_returns_empty(self, repor_profile_manager):
-        """get_goals_for_profile with 'none' should return empty list."""
+        """get_goals_for_profile with 'none' should return an empty tuple."""
         goals = repor_profile_manager.get_goals_for_profile("none")
-        assert goals == []
+        assert goals == ()
 
     def test_all_repor_profiles_have_goals(self, repor_profile_manager):
         """All repor profiles should have goals defined."""
@@ -153,6 +252,20 @@ class TestReporProfileManager:
             assert len(profile["goals"]) > 0
 
 
+class TestSharedManagers:
+    """Tests for the process-wide shared profile managers."""
+
+    def test_get_profile_manager_returns_shared_instance(self):
+        """get_profile_manager should return the same instance every call."""
+        assert isinstance(get_profile_manager(), ProfileManager)
+        assert get_profile_manager() is get_profile_manager()
+
+    def test_get_repor_profile_manager_returns_shared_instance(self):
+        """get_repor_profile_manager should return the same instance every call."""
+        assert isinstance(get_repor_profile_manager(), ReporProfileManager)
+        assert get_repor_profile_manager() is get_repor_profile_manager()
+
+
 class TestProfileConstants:
     """Tests for profile constant definitions."""
 
@@ -175,4 +288,4 @@ class TestProfileConstants:
         for key, profile in REPOR_PROFILES.items():
             assert "name" in profile, f"Repor profile '{key}' missing 'name'"
             assert "goals" in profile, f"Repor profile '{key}' missing 'goals'"
-            assert isinstance(profile["goals"], list)
+            assert isinstance(profile["goals"], tuple)
@@ -2,7 +2,9 @@
 
 import pytest
 from datetime import datetime
+from pathlib import Path
 
+from geck_generator.core import templates
 from geck_generator.core.templates import (
     TemplateEngine,
     LLM_INIT_TEMPLATE,
@@ -21,6 +23,10 @@ class TestTemplateEngine:
         """TemplateEngine should create a Jinja2 environment."""
         assert template_engine.env is not None
 
+    def test_engines_share_jinja_environment(self, template_engine):
+        """All TemplateEngine instances should reuse one Jinja2 environment."""
+        assert TemplateEngine().env is template_engine.env
+
     def test_list_templates_returns_builtin(self, template_engine):
         """list_templates should return built-in template names."""
         templates = template_engine.list_templates()
@@ -57,6 +63,11 @@ class TestTemplateEngine:
         today = datetime.now().strftime("%Y-%m-%d")
         assert today in result
 
+    def test_render_keeps_supplied_date(self, template_engine):
+        """render should use a caller-supplied created_date."""
+        result = template_engine.render("llm_init", {"project_name": "Test", "created_date": "1999-12-31"})
+        assert "1999-12-31" in result
+
     def test_render_geck_inst_template(self, template_engine):
         """render should produce valid GECK_Inst content."""
         result = template_engine.render("geck_inst", {})
@@ -136,6 +147,31 @@ class TestTemplateEngine:
         today = datetime.now().strftime("%Y-%m-%d")
         assert today in result
 
+    def test_precompile_compiles_builtin_templates(self, template_engine):
+        """precompile should compile every built-in template."""
+        names = template_engine.precompile()
+        assert names == list(TemplateEngine.TEMPLATES)
+
+    def test_builtin_templates_compiled_once(self, template_engine):
+        """Rendering a built-in template should reuse its compiled Template."""
+        template_engine.render("tasks", {"project_name": "A"})
+        compiled = templates._COMPILED_TEMPLATES["tasks"]
+        template_engine.render("tasks", {"project_name": "B"})
+        assert templates._COMPILED_TEMPLATES["tasks"] is compiled
+
+    def test_static_templates_match_jinja_output(self, template_engine):
+        """Templates rendered without Jinja2 should match the Jinja2 output."""
+        for name in templates._STATIC_TEMPLATES:
+            expected = templates._get_builtin_template(name).render()
+            assert template_engine.render(name, {}) == expected
+
+    def test_template_strings_compiled_once(self, template_engine):
+        """Rendering the same template string again should reuse its compiled Template."""
+        template_engine.render_string("Hi {{ name }}", {"name": "A"})
+        compiled = templates._compile_string("Hi {{ name }}")
+        assert template_engine.render_string("Hi {{ name }}", {"name": "B"}) == "Hi B"
+        assert templates._compile_string("Hi {{ name }}") is compiled
+
     def test_add_template(self, template_engine):
         """add_template should register a custom template."""
         template_engine.add_template("custom", "Custom: {{ value }}")
@@ -169,6 +205,27 @@ class TestTemplateEngine:
         assert "Test" in result
 
 
+class TestBytecodeCache:
+    """Tests for the on-disk Jinja2 bytecode cache."""
+
+    def test_bytecode_cache_uses_user_cache_dir(self, temp_dir, monkeypatch):
+        """The bytecode cache should live under the user cache directory."""
+        monkeypatch.setattr(templates, "_user_cache_dir", lambda: temp_dir / "geck")
+        cache = templates._get_bytecode_cache()
+
+        assert cache is not None
+        assert Path(cache.directory) == temp_dir / "geck" / "jinja_bc"
+        assert Path(cache.directory).is_dir()
+
+    def test_bytecode_cache_disabled_when_dir_unusable(self, temp_dir, monkeypatch):
+        """An unusable cache directory should disable caching, not fail."""
+        blocker = temp_dir / "not_a_dir"
+        blocker.write_text("", encoding="utf-8")
+        monkeypatch.setattr(templates, "_user_cache_dir", lambda: blocker)
+
+        assert templates._get_bytecode_cache() is None
+
+
 class TestTemplateConstants:
     """Tests for template constant definitions."""
 